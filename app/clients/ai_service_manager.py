@@ -290,6 +290,12 @@ class AIServiceManager:
             
         return sorted(scenarios, key=scenario_score)
 
+    def close(self) -> None:
+        """Release the enhanced client's worker threads and disk cache, and the fallback creator's Jira connections"""
+        self.enhanced_ai.close()
+        if self.manual_creator is not None:
+            self.manual_creator.jira_client.close()
+
     def get_service_status(self) -> Dict[str, Any]:
         """Get status of all AI services"""
         return {
@@ -5,26 +5,31 @@ from loguru import logger
 import json
 
 class APIClient:
-    def __init__(self, base_url, headers, default_timeout=30, max_retries=3):
+    def __init__(self, base_url, headers, default_timeout=30, max_retries=3, send=None):
+        """
+        send: optional request gate with the session.request signature (minus timeout) that every
+        request goes through; it owns rate limiting (429 / Retry-After)
+        """
         self.base_url = base_url.rstrip('/')
         self.headers = headers
         self.default_timeout = default_timeout
+        self._send = send
         
         # Initialize session with connection pooling
         self.session = requests.Session()
         
-        # Configure retry strategy
+        # Configure retry strategy (server errors only: 429 is left to the request gate, which reads Retry-After)
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 503, 504],
         )
         
-        # Mount adapter with retry strategy and connection pooling
+        # Mount adapter with retry strategy and connection pooling (one Jira host, so few pools but many keep-alive sockets)
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=100,  # Maintain up to 100 connections
-            pool_maxsize=100,     # Maximum 100 connections per pool
+            pool_connections=10,  # Host pools kept alive
+            pool_maxsize=50,      # Keep-alive connections per host
             pool_block=False      # Don't block when pool is full
         )
         
@@ -62,35 +67,33 @@ class APIClient:
             logger.error(f"Error handling response: {str(e)}")
             raise
 
-    def get(self, endpoint, params=None):
-        """Make GET request with connection pooling"""
+    def _request(self, method, endpoint, data=None, params=None):
+        """Send a request over the pooled keep-alive session and handle the response"""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.debug(f"GET {url}")
-        response = self.session.get(url, params=params, timeout=self.default_timeout)
+        logger.debug(f"{method} {url}")
+        if data is not None:
+            logger.opt(lazy=True).debug("Request data: {}", lambda: json.dumps(data))
+        if self._send is not None:
+            response = self._send(method, url, json=data, params=params)
+        else:
+            response = self.session.request(method, url, json=data, params=params, timeout=self.default_timeout)
         return self._handle_response(response)
 
+    def get(self, endpoint, params=None):
+        """Make GET request with connection pooling"""
+        return self._request('GET', endpoint, params=params)
+
     def post(self, endpoint, data, params=None):
         """Make POST request with connection pooling"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.debug(f"POST {url}")
-        logger.debug(f"Request data: {json.dumps(data)}")
-        response = self.session.post(url, json=data, params=params, timeout=self.default_timeout)
-        return self._handle_response(response)
+        return self._request('POST', endpoint, data, params)
 
     def put(self, endpoint, data, params=None):
         """Make PUT request with connection pooling"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.debug(f"PUT {url}")
-        logger.debug(f"Request data: {json.dumps(data)}")
-        response = self.session.put(url, json=data, params=params, timeout=self.default_timeout)
-        return self._handle_response(response)
+        return self._request('PUT', endpoint, data, params)
 
     def delete(self, endpoint, params=None):
         """Make DELETE request with connection pooling"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.debug(f"DELETE {url}")
-        response = self.session.delete(url, params=params, timeout=self.default_timeout)
-        return self._handle_response(response)
+        return self._request('DELETE', endpoint, params=params)
 
     def __del__(self):
         """Cleanup session on object destruction"""
@@ -2,17 +2,376 @@
 Enhanced AI Client - ChatGPT-4o-mini Level Quality with Free LLMs
 Primary AI engine for comprehensive requirement analysis and test scenario generation
 """
+import os
 import json
+import atexit
+import socket
+import hashlib
+import sqlite3
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
 from loguru import logger
 from datetime import datetime
 import re
-from functools import lru_cache
+from enum import Enum
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import defaultdict, deque
+import statistics
+from functools import lru_cache, cached_property
 
 from app.clients.cursor_ai_client import CursorAIClient
 from config.config import get_ai_config
+from app.utils import json_utils
+from app.utils.token_utils import truncate_to_tokens
+from app.clients.llm_cache import LLMCache
+
+# Pre-compiled patterns for cleaning markdown artifacts out of LLM responses
+_RE_MD_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_RE_MD_ITALIC = re.compile(r'\*([^*]+)\*')
+_RE_MD_BULLET = re.compile(r'^[\+\-\*]\s*', re.MULTILINE)
+_RE_MD_NUMBERED = re.compile(r'^\d+\.\s*', re.MULTILINE)
+_RE_PREAMBLE_HERE = re.compile(r'Here are the.*?scenarios.*?:', re.IGNORECASE)
+_RE_PREAMBLE_BELOW = re.compile(r'Below are.*?scenarios.*?:', re.IGNORECASE)
+# Scalar scenario fields in JSON-like text, captured in one linear scan
+_RE_SCENARIO_FIELD = re.compile(r'"(title|description|severity|priority|automation)"\s*:\s*"([^"]+)"')
+_RE_SCENARIO_STEPS = re.compile(r'"steps"\s*:\s*\[(.*?)\]', re.DOTALL)
+_RE_QUOTED = re.compile(r'"([^"]+)"')
+# JSON extraction/repair patterns for LLM responses
+_RE_JSON_ARRAY = re.compile(r'\[[\s\S]*\]')
+_RE_JSON_LIKE_SCENARIO = re.compile(r'\{[^{}]*"title"[^{}]*\}', re.DOTALL)
+_RE_ADJACENT_OBJECTS = re.compile(r'}\s*{')
+_RE_QUOTE_OBJECT_GAP = re.compile(r'"\s*}\s*{')
+_RE_QUOTE_OBJECT_END = re.compile(r'"\s*}\s*]')
+_RE_BARE_KEY = re.compile(r'(\w+):')
+_RE_TRAILING_COMMA_OBJ = re.compile(r',\s*}')
+_RE_TRAILING_COMMA_ARR = re.compile(r',\s*]')
+# Line-level cleanup patterns for the text-to-scenario fallback
+_RE_STEP_NUMBER = re.compile(r'^\d+\.')
+_RE_STEP_NUMBER_PREFIX = re.compile(r'^\d+\.\s*')
+_RE_BULLET_PREFIX = re.compile(r'^[-*•]\s*')
+_RE_TITLE_LABEL = re.compile(r'^(title|scenario|test):\s*', re.IGNORECASE)
+_RE_STEPS_LABEL = re.compile(r'steps?:\s*', re.IGNORECASE)
+_RE_DESCRIPTION_LABEL = re.compile(r'description:\s*', re.IGNORECASE)
+_RE_QUOTE_HEAD = re.compile(r'^["\'\[\{]*')
+_RE_QUOTE_TAIL = re.compile(r'["\'\]\}]*$')
+_RE_QUOTE_TAIL_COMMA = re.compile(r'["\'\]\},]*$')
+# Keyword scans for line classification (run on the lowercased line)
+_RE_NUMBERED_TITLE_WORDS = re.compile(r'test|verify|check|validate')
+_RE_TITLE_WORDS = re.compile(r'test|scenario|verify|validate')
+_RE_STEP_LABELS = re.compile(r'step:|action:|verify:|check:')
+# Prompt normalisation for the scenario response cache: only whitespace runs are collapsed, since
+# case and punctuation ("age < 18" vs "age > 18") change what the model is asked
+_RE_PROMPT_WHITESPACE = re.compile(r'\s+')
+# Single scan telling whether any of the cleaning patterns above could match
+_RE_NEEDS_CLEANING = re.compile(r'[*+]|^(?:-|\d+\.)|here are|below are', re.IGNORECASE | re.MULTILINE)
+
+# Markdown markers and leading list numbering stripped from scenario fields
+_MARKUP_TABLE = str.maketrans('', '', '*+-')
+_RE_LEADING_NUMBERING = re.compile(r'^[\d\.\s]+')
+
+def _strip_markup(text: str) -> str:
+    """Remove markdown markers anywhere and list numbering at the start"""
+    return _RE_LEADING_NUMBERING.sub('', text.translate(_MARKUP_TABLE)).strip()
+
+def _clean_scenario_fields(title: str, description: str, steps: List[Any]) -> Tuple[str, str, List[str]]:
+    """
+    Hot inner cleaner for parsed scenarios: title, description and steps in one call.
+    Kept as a single pure function so the per-scenario work stays in C-level str/re calls.
+    """
+    return (
+        _strip_markup(title),
+        description.translate(_MARKUP_TABLE).strip(),
+        [clean for step in steps if isinstance(step, str) and len(clean := _strip_markup(step)) > 5]
+    )
+
+# Analysis fields the scenario prompts actually use (the rest only costs prompt budget)
+_ANALYSIS_KEYS_FOR_PROMPT = (
+    'main_functionality', 'domain', 'acceptance_criteria', 'business_rules',
+    'integration_points', 'data_elements', 'edge_cases', 'error_scenarios'
+)
+
+# Single-story Groq prompt; its hash is part of the scenario cache key so template edits invalidate old entries
+_FAST_SCENARIO_MODEL = 'llama-3.1-8b-instant'
+_FAST_SCENARIO_PROMPT = """Generate 8 test scenarios for: {summary}
+
+IMPORTANT: Create clear, actionable test scenario titles. No markdown formatting, no generic titles.
+
+Example format:
+[
+{{"title": "Verify user can view wallet balance on main page", "description": "Test wallet balance display functionality", "steps": ["1. Login to application", "2. Navigate to wallet page", "3. Verify balance shows correctly"], "severity": "S2 - Major", "priority": "P2 - High", "automation": "Manual"}},
+{{"title": "Test wallet balance updates after transaction", "description": "Verify balance reflects changes after payment", "steps": ["1. Check initial balance", "2. Make a transaction", "3. Verify updated balance"], "severity": "S1 - Critical", "priority": "P1 - Critical", "automation": "Manual"}}
+]
+
+Requirements:
+- Each title must be specific and actionable (start with "Verify", "Test", "Check")
+- No generic titles like "Test Scenario"
+- No markdown symbols (**, *, +, -)
+- Cover: positive tests, error handling, edge cases
+- Return ONLY the JSON array, nothing else"""
+_FAST_PROMPT_HASH = hashlib.blake2b(_FAST_SCENARIO_PROMPT.encode(), digest_size=4).hexdigest()
+
+# Static HF system instruction, kept byte-identical across calls so provider-side prompt caches can hit
+_SCENARIO_SYSTEM = (
+    'You generate 3-5 QA test scenarios. Output ONLY JSON: '
+    '[{"title":"...","description":"...","steps":["..."]}]'
+)
+
+# Static parts of every HF Providers chat request, built once (the system message dict is shared, never mutated)
+_HF_CHAT_URL = "https://router.huggingface.co/hf-inference/v1/chat/completions"
+_HF_MODEL = 'microsoft/DialoGPT-medium'
+_HF_SYSTEM_MESSAGE = {'role': 'system', 'content': _SCENARIO_SYSTEM}
+
+class _DiskCache:
+    """Small sqlite-backed key/value store with TTL, shared across processes"""
+
+    def __init__(self, path: str, ttl: int):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value, or None when missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM cache WHERE key = ? AND expires > ?', (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value, replacing any previous entry for the key"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)',
+                (key, value, time.time() + self.ttl)
+            )
+            self._conn.commit()
+
+def _is_scenario_payload(value: Any) -> bool:
+    """True for a JSON object or a non-empty array of objects (what scenario responses look like)"""
+    if isinstance(value, dict):
+        return True
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) for item in value)
+
+def _read_until_json_complete(fragments: Iterable[str]) -> str:
+    """
+    Join streamed text fragments, stopping as soon as the first complete top-level
+    JSON object, or non-empty array of objects, has arrived (the model's trailing chatter is never waited for)
+    """
+    parts = []
+    offset = 0
+    depth = 0
+    start = 0
+    in_string = escaped = False
+    for fragment in fragments:
+        parts.append(fragment)
+        for i, ch in enumerate(fragment):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == '\\':
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = depth > 0
+            elif ch in '[{':
+                if depth == 0:
+                    start = offset + i
+                depth += 1
+            elif ch in ']}' and depth:
+                depth -= 1
+                if depth == 0:
+                    text = ''.join(parts)
+                    end = offset + i + 1
+                    try:
+                        value = json_utils.loads(text[start:end])
+                    except ValueError:
+                        continue  # Bracketed prose, not the payload; keep reading
+                    if _is_scenario_payload(value):
+                        return text[:end]
+                    # Valid JSON but not scenarios (e.g. "the [5] scenarios"); keep reading
+        offset += len(fragment)
+    return ''.join(parts)
+
+def _iter_sse_content(response: requests.Response) -> Iterator[str]:
+    """Yield content deltas from an OpenAI-style server-sent event stream"""
+    response.encoding = 'utf-8'  # text/event-stream responses usually omit the charset
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith('data: '):
+            continue
+        data = line[6:]
+        if data == '[DONE]':
+            break
+        choices = json_utils.loads(data).get('choices') or []
+        if choices:
+            content = choices[0].get('delta', {}).get('content')
+            if content:
+                yield content
+
+@lru_cache(maxsize=4096)
+def _title_tokens(text: str) -> frozenset:
+    """Lowercased word set of a title, computed once per distinct title"""
+    return frozenset(text.lower().split())
+
+class _TitleIndex:
+    """Inverted word index over kept titles for near-duplicate checks (word Jaccard > threshold)"""
+
+    def __init__(self, threshold: float = 0.8):
+        self.threshold = threshold
+        self._sizes = []
+        # word -> kept titles containing it, so only titles sharing a word are compared
+        self._word_index = defaultdict(list)
+
+    def is_duplicate(self, words: frozenset) -> bool:
+        """True if any indexed title is more similar than the threshold"""
+        # Count shared words per candidate; Jaccard = shared / (|a| + |b| - shared)
+        shared_counts = defaultdict(int)
+        for word in words:
+            for kept_id in self._word_index.get(word, ()):
+                shared_counts[kept_id] += 1
+        return any(
+            shared / (len(words) + self._sizes[kept_id] - shared) > self.threshold
+            for kept_id, shared in shared_counts.items()
+        )
+
+    def add(self, words: frozenset) -> None:
+        """Index a kept title's words"""
+        kept_id = len(self._sizes)
+        self._sizes.append(len(words))
+        for word in words:
+            self._word_index[word].append(kept_id)
+
+class _LineKind(Enum):
+    """What a line of free-text LLM output contributes to the scenario being rebuilt"""
+    SKIP = 'skip'
+    TITLE = 'title'
+    STEP = 'step'
+    DESC = 'description'
+
+class _TokenBucket:
+    """Continuously refilling request budget (no hourly reset cliff), safe to share between threads"""
+
+    def __init__(self, rate: int, per_seconds: float):
+        self.capacity = float(rate)
+        self.tokens = float(rate)
+        self.refill_per_second = rate / per_seconds
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take one token if available"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_per_second)
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+# Label keywords for free-text analysis (substring matches, so "payments"/"users" count too)
+_FUNC_PAYMENTS = frozenset({'payment', 'checkout', 'invoice', 'transaction'})
+_FUNC_USER_MANAGEMENT = frozenset({'login', 'authentication', 'register', 'user'})
+_DOM_FINANCE = frozenset({'finance', 'billing', 'revenue', 'cost'})
+_DOM_LOGISTICS = frozenset({'logistics', 'shipping', 'warehouse', 'inventory'})
+
+def _keyword_pattern(keywords: frozenset) -> re.Pattern:
+    """One alternation per keyword set: a single C-level scan instead of a Python loop of `in` checks"""
+    return re.compile('|'.join(sorted(map(re.escape, keywords))))
+
+# Checked in priority order
+_FUNCTIONALITY_LABELS = (
+    (_keyword_pattern(_FUNC_PAYMENTS), 'Payments'),
+    (_keyword_pattern(_FUNC_USER_MANAGEMENT), 'User Management'),
+)
+_DOMAIN_LABELS = (
+    (_keyword_pattern(_DOM_FINANCE), 'Finance'),
+    (_keyword_pattern(_DOM_LOGISTICS), 'Logistics'),
+)
+
+# Request bodies are pre-serialized with json_utils, so the content type is set explicitly
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Integration names and rule statements that tickets/analysis text often spell out literally
+_INTEGRATION_RE = re.compile(r'\b(stripe|paypal|salesforce|kafka|s3|sns|sqs|twilio|slack|jira|github)\b', re.IGNORECASE)
+_RULE_RE = re.compile(r'\b(?:rule|must|shall|should)[:\s]+([^.\n]{5,120})', re.IGNORECASE)
+
+def _match_label(labels: Tuple[Tuple[re.Pattern, str], ...], text_lower: str) -> str:
+    """First label (in priority order) whose keyword alternation occurs in the text"""
+    for pattern, label in labels:
+        if pattern.search(text_lower):
+            return label
+    return "General"
+
+# The same ticket/analysis text passes through several pipeline stages; classify each distinct text once
+@lru_cache(maxsize=4096)
+def _text_labels(text: str) -> Tuple[str, str]:
+    """(functionality, domain) labels of a text"""
+    text_lower = text.lower()
+    return _match_label(_FUNCTIONALITY_LABELS, text_lower), _match_label(_DOMAIN_LABELS, text_lower)
+
+@lru_cache(maxsize=4096)
+def _text_rules(text: str) -> Tuple[str, ...]:
+    """Rule statements in first-seen order, repeats dropped"""
+    return tuple(dict.fromkeys(match.strip() for match in _RULE_RE.findall(text)))
+
+@lru_cache(maxsize=4096)
+def _text_integrations(text: str) -> Tuple[str, ...]:
+    """Sorted, lowercased integration names"""
+    return tuple(sorted({match.lower() for match in _INTEGRATION_RE.findall(text)}))
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets send small writes immediately and probe idle connections"""
+
+    # TCP_NODELAY (urllib3's default) disables Nagle's ~40ms coalescing of small request bodies;
+    # SO_KEEPALIVE stops idle pooled connections to slow providers being silently dropped by middleboxes
+    _SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self._SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+# Keep-alive connections per host in the shared pool: full provider fan-outs from a few clients at once
+# never open throwaway connections beyond it
+_HTTP_POOL_MAXSIZE = 32
+
+@lru_cache(maxsize=1)
+def _shared_http() -> requests.Session:
+    """Session shared by every EnhancedAIClient, so instances reuse one keep-alive pool per provider host"""
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},  # LLM completions are safe to resend
+        raise_on_status=False  # Hand the final error response back to the caller's status handling
+    )
+    adapter = _KeepAliveAdapter(
+        pool_connections=10,
+        pool_maxsize=_HTTP_POOL_MAXSIZE,
+        max_retries=retry_strategy
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    atexit.register(session.close)
+    return session
 
 class EnhancedAIClient:
     """
@@ -20,6 +379,35 @@ class EnhancedAIClient:
     Uses free LLM services as primary with ChatGPT-level prompting and analysis
     """
     
+    # Shared constants for scenario cleanup (built once, reused per scenario)
+    _ACTION_WORDS = ('verify', 'test', 'check', 'validate', 'ensure', 'confirm')
+    _GENERIC_TITLES = frozenset({'test scenario', 'scenario', 'test case', 'test'})
+    _DEFAULT_STEPS = (
+        '1. Navigate to the relevant page or section',
+        '2. Execute the required test actions',
+        '3. Verify the expected outcome occurs',
+        '4. Document the test results'
+    )
+    _JSON_DECODER = json.JSONDecoder()
+    # Line classification for the text-to-scenario fallback
+    _JSON_ARTIFACT_LINES = frozenset({'{', '}', '[', ']', '},{'})
+    _TITLE_LABELS = ('title:', 'scenario:', 'test:')
+    _STEP_MARKERS = ('-', '*', '•')
+    # Circuit breaker: this many failures within the window opens a provider for the cooldown
+    _BREAKER_FAILURE_THRESHOLD = 3
+    _BREAKER_WINDOW_SECONDS = 60
+    _BREAKER_COOLDOWN_SECONDS = 60
+    # HF timeout adapts to recent successful latencies (p99 x 1.5) once enough samples exist
+    _HF_DEFAULT_TIMEOUT = 30
+    _HF_MIN_TIMEOUT = 5
+    _HF_LATENCY_SAMPLES = 50
+    _HF_MIN_LATENCY_SAMPLES = 10
+    # Worker threads: scenario-type fan-out, and provider calls raced for each type (3 providers x 4 types)
+    _FANOUT_WORKERS = 4
+    _PROVIDER_WORKERS = 12
+    # Ticket text budget per HF prompt, in tokens (character slicing over/under-shoots across languages)
+    _HF_PROMPT_TOKENS = 300
+    
     def __init__(self):
         self.config = get_ai_config()
         self.fallback_ai = CursorAIClient()  # Your current implementation as fallback
@@ -53,10 +441,25 @@ class EnhancedAIClient:
             }
         }
         
+        # Process-wide keep-alive session for all providers (one TLS handshake per host, centralized retries)
+        self.http = _shared_http()
+        
+        # Hot-path shortcuts for the Groq fast path (no per-call dict lookups)
+        self._groq_enabled = self.llm_services['groq']['enabled']
+        self._groq_limiter = _TokenBucket(rate=self.llm_services['groq']['rate_limit'], per_seconds=3600)
+        
         # PERFORMANCE OPTIMIZATIONS
         # Scenario caching for similar stories
         self.scenario_cache = {}
         self.cache_enabled = self.config.get('cache_scenarios', True)
+        # Persistent second level so one-story-per-run CLI usage still gets cache hits
+        self._disk_cache = self._open_disk_cache() if self.cache_enabled else None
+        # Exact-match cache of deterministic provider responses (memory LRU, written through to disk)
+        self.llm_cache = LLMCache(
+            backend=self._disk_cache,
+            ttl=self.config.get('cache_ttl', 604800),
+            enabled=self.cache_enabled
+        )
         
         # Pre-compiled patterns for faster text processing
         self.domain_patterns = {
@@ -66,17 +469,34 @@ class EnhancedAIClient:
             'finance': re.compile(r'\b(finance|financial|budget|cost|expense|revenue)\b', re.I)
         }
         
-        # Advanced prompting templates for comprehensive analysis
-        self.analysis_prompts = {
-            'requirement_analysis': self._get_requirement_analysis_prompt(),
-            'scenario_generation': self._get_scenario_generation_prompt(),
-            'edge_case_analysis': self._get_edge_case_prompt(),
-            'negative_testing': self._get_negative_testing_prompt()
+        # Per-service request budgets for free tiers (Groq shares the fast-path bucket)
+        self._rate_limiters = {
+            service: self._groq_limiter if service == 'groq'
+            else _TokenBucket(rate=service_config.get('rate_limit', 100), per_seconds=3600)
+            for service, service_config in self.llm_services.items()
+        }
+        
+        # Per-provider circuit breakers so a failing service is skipped instead of timing out repeatedly
+        self._breakers = {
+            service: {'failures': 0, 'window_start': 0.0, 'open_until': 0.0}
+            for service in self.llm_services
         }
+        self._breaker_lock = threading.Lock()
+        self._hf_latencies = deque(maxlen=self._HF_LATENCY_SAMPLES)
         
-        # Request tracking for free services
-        self.request_counts = {}
-        self.last_reset_time = time.time()
+        # Race all providers per prompt (latency ~ fastest provider) or ask them one at a time in preference order
+        # Opt-in: a race charges every remote provider, and a started call runs to completion even when it loses
+        self._hedge_requests = self.config.get('hedge_ai_requests', False)
+        
+        # Cross-story title dedupe (opt-in: by default every story keeps its own full scenario set)
+        self._dedupe_across_stories = self.config.get('dedupe_across_stories', False)
+        self._global_title_index = _TitleIndex()
+        self._global_title_lock = threading.Lock()
+        
+        # Scenario-type fan-out: the per-type LLM calls are I/O bound, so run them concurrently
+        self._fanout_executor = ThreadPoolExecutor(max_workers=self._FANOUT_WORKERS, thread_name_prefix='scenario-fanout')
+        # Separate pool for the provider race so fan-out workers never wait on their own pool
+        self._provider_executor = ThreadPoolExecutor(max_workers=self._PROVIDER_WORKERS, thread_name_prefix='llm-provider')
         
         logger.info("Enhanced AI Client initialized with performance optimizations")
 
@@ -87,10 +507,11 @@ class EnhancedAIClient:
         try:
             # OPTIMIZATION 1: Check cache first
             cache_key = self._generate_cache_key(story)
-            if self.cache_enabled and cache_key in self.scenario_cache:
+            cached = self._get_cached_scenarios(cache_key)
+            if cached is not None:
                 if verbose:
                     logger.info("✅ Using cached scenarios (instant)")
-                return self.scenario_cache[cache_key]
+                return cached
             
             # OPTIMIZATION 2: Fast story analysis
             story_context = self._fast_story_analysis(story)
@@ -108,26 +529,69 @@ class EnhancedAIClient:
             # OPTIMIZATION 4: Quick validation and enhancement
             validated_scenarios = self._validate_and_enhance_scenarios(scenarios, story)
             
-            # OPTIMIZATION 5: Cache the result
-            result = json.dumps(validated_scenarios, indent=2)
-            if self.cache_enabled:
-                self.scenario_cache[cache_key] = result
+            # OPTIMIZATION 5: Cache the compact result; pretty-print only for verbose output
+            result = json_utils.dumps(validated_scenarios)
+            self._store_cached_scenarios(cache_key, result)
             
-            return result
+            return json_utils.dumps(validated_scenarios, indent=True) if verbose else result
             
         except Exception as e:
             if verbose:
                 logger.error(f"Enhanced AI failed: {str(e)}, falling back")
             return self.fallback_ai.generate_test_scenarios(story, verbose)
 
+    def close(self) -> None:
+        """Release worker threads and the disk cache (the shared HTTP pool stays up for other clients; closed at exit)"""
+        self._fanout_executor.shutdown(wait=False)
+        self._provider_executor.shutdown(wait=False)
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
     def _generate_cache_key(self, story: Dict) -> str:
         """Generate cache key based on story content for scenario reuse"""
         fields = story.get('fields', {})
         summary = fields.get('summary', '')
-        # Create a hash of key story elements
-        import hashlib
-        key_content = f"{summary[:100]}"  # Use first 100 chars of summary
-        return hashlib.md5(key_content.encode()).hexdigest()[:8]
+        # Non-cryptographic use: blake2b is faster than MD5 and yields the same 8-hex-char key width
+        key_content = summary[:100]  # Use first 100 chars of summary
+        summary_hash = hashlib.blake2b(key_content.encode(), digest_size=4).hexdigest()
+        # Model and prompt version in the key: a model or template change never serves stale entries
+        return f"{_FAST_SCENARIO_MODEL}:{_FAST_PROMPT_HASH}:{summary_hash}"
+
+    def _open_disk_cache(self) -> Optional[_DiskCache]:
+        """Open the persistent scenario cache, or None when disabled/unavailable"""
+        cache_path = self.config.get('cache_path', '')
+        if not cache_path:
+            return None
+        try:
+            return _DiskCache(cache_path, ttl=self.config.get('cache_ttl', 604800))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"⚠️ Scenario disk cache unavailable ({e}), using memory cache only")
+            return None
+
+    def _get_cached_scenarios(self, cache_key: str) -> Optional[str]:
+        """Look up cached scenarios: in-memory dict first, then the disk cache"""
+        if not self.cache_enabled:
+            return None
+        result = self.scenario_cache.get(cache_key)
+        if result is None and self._disk_cache is not None:
+            try:
+                result = self._disk_cache.get(cache_key)
+            except sqlite3.Error:
+                result = None
+            if result is not None:
+                self.scenario_cache[cache_key] = result
+        return result
+
+    def _store_cached_scenarios(self, cache_key: str, result: str) -> None:
+        """Write scenarios through to the in-memory and disk caches"""
+        if not self.cache_enabled:
+            return
+        self.scenario_cache[cache_key] = result
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.set(cache_key, result)
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Failed to persist scenarios to disk cache: {e}")
 
     def _fast_story_analysis(self, story: Dict) -> Dict:
         """OPTIMIZED: Ultra-fast story analysis using pattern matching"""
@@ -159,7 +623,7 @@ class EnhancedAIClient:
         ULTRA-OPTIMIZED: Generate scenarios with maximum speed optimizations
         """
         # Try Groq with ultra-optimized settings
-        if self.llm_services['groq']['enabled'] and self._check_rate_limit('groq'):
+        if self._groq_enabled and self._groq_limiter.try_acquire():
             try:
                 scenarios = self._groq_ultra_fast(story, context, verbose)
                 if scenarios and len(scenarios) >= 5:
@@ -181,22 +645,7 @@ class EnhancedAIClient:
             # IMPROVED PROMPT: More specific about format and quality
             summary = story.get('fields', {}).get('summary', '')
             
-            prompt = f"""Generate 8 test scenarios for: {summary}
-
-IMPORTANT: Create clear, actionable test scenario titles. No markdown formatting, no generic titles.
-
-Example format:
-[
-{{"title": "Verify user can view wallet balance on main page", "description": "Test wallet balance display functionality", "steps": ["1. Login to application", "2. Navigate to wallet page", "3. Verify balance shows correctly"], "severity": "S2 - Major", "priority": "P2 - High", "automation": "Manual"}},
-{{"title": "Test wallet balance updates after transaction", "description": "Verify balance reflects changes after payment", "steps": ["1. Check initial balance", "2. Make a transaction", "3. Verify updated balance"], "severity": "S1 - Critical", "priority": "P1 - Critical", "automation": "Manual"}}
-]
-
-Requirements:
-- Each title must be specific and actionable (start with "Verify", "Test", "Check")
-- No generic titles like "Test Scenario"
-- No markdown symbols (**, *, +, -)
-- Cover: positive tests, error handling, edge cases
-- Return ONLY the JSON array, nothing else"""
+            prompt = _FAST_SCENARIO_PROMPT.format(summary=summary)
 
             headers = {
                 'Authorization': f'Bearer {groq_token}',
@@ -205,7 +654,7 @@ Requirements:
             
             # OPTIMIZED PAYLOAD with better quality controls
             payload = {
-                'model': 'llama-3.1-8b-instant',
+                'model': _FAST_SCENARIO_MODEL,
                 'messages': [{'role': 'user', 'content': prompt}],
                 'temperature': 0.2,  # Slightly higher for better creativity while maintaining consistency
                 'max_tokens': 1500,  # Increased slightly for better quality
@@ -213,15 +662,15 @@ Requirements:
                 'stream': False
             }
             
-            response = requests.post(
+            response = self.http.post(
                 'https://api.groq.com/openai/v1/chat/completions',
                 headers=headers,
-                json=payload,
+                data=json_utils.dumps_bytes(payload),
                 timeout=20
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = json_utils.loads(response.content)
                 content = result['choices'][0]['message']['content']
                 if verbose:
                     logger.info(f"🔍 Groq response length: {len(content)} characters")
@@ -244,49 +693,45 @@ Requirements:
         try:
             # First, try to parse the response as JSON directly
             try:
-                scenarios = json.loads(response_text)
+                scenarios = json_utils.loads(response_text)
                 if isinstance(scenarios, list) and len(scenarios) > 0:
                     logger.info(f"✅ Direct JSON parsing successful: {len(scenarios)} scenarios")
-                    # Validate and clean each scenario
-                    cleaned_scenarios = []
-                    for scenario in scenarios:
-                        cleaned_scenario = self._validate_and_clean_scenario(scenario)
-                        if cleaned_scenario:
-                            cleaned_scenarios.append(cleaned_scenario)
-                    return cleaned_scenarios
+                    return self._clean_scenario_list(scenarios)
             except json.JSONDecodeError as e:
                 logger.debug(f"Direct JSON parsing failed: {e}")
                 pass  # Try other methods
             
+            # Forward scan: decode the first JSON array of objects, skipping bracketed prose like "[5]"
+            array_start = response_text.find('[')
+            while array_start >= 0:
+                try:
+                    scenarios, end = self._JSON_DECODER.raw_decode(response_text, array_start)
+                except json.JSONDecodeError as e:
+                    logger.debug(f"Embedded JSON parsing failed: {e}")
+                    array_start = response_text.find('[', array_start + 1)
+                    continue
+                if isinstance(scenarios, list) and _is_scenario_payload(scenarios):
+                    logger.info(f"✅ Embedded JSON parsing successful: {len(scenarios)} scenarios")
+                    return self._clean_scenario_list(scenarios)
+                array_start = response_text.find('[', end)
+            
             # Clean the response and try to extract JSON array
             cleaned_text = self._clean_response_text(response_text)
-            import re
-            json_match = re.search(r'\[[\s\S]*\]', cleaned_text)
+            json_match = _RE_JSON_ARRAY.search(cleaned_text)
             if json_match:
                 try:
-                    scenarios = json.loads(json_match.group())
+                    scenarios = json_utils.loads(json_match.group())
                     if isinstance(scenarios, list) and len(scenarios) > 0:
-                        # Validate and clean each scenario
-                        cleaned_scenarios = []
-                        for scenario in scenarios:
-                            cleaned_scenario = self._validate_and_clean_scenario(scenario)
-                            if cleaned_scenario:
-                                cleaned_scenarios.append(cleaned_scenario)
-                        return cleaned_scenarios
+                        return self._clean_scenario_list(scenarios)
                 except json.JSONDecodeError as e:
                     logger.debug(f"Regex JSON parsing failed: {e}")
                     # Try to fix common JSON issues
                     fixed_json = self._fix_malformed_json(json_match.group())
                     if fixed_json:
                         try:
-                            scenarios = json.loads(fixed_json)
+                            scenarios = json_utils.loads(fixed_json)
                             if isinstance(scenarios, list) and len(scenarios) > 0:
-                                # Validate and clean each scenario
-                                cleaned_scenarios = []
-                                for scenario in scenarios:
-                                    cleaned_scenario = self._validate_and_clean_scenario(scenario)
-                                    if cleaned_scenario:
-                                        cleaned_scenarios.append(cleaned_scenario)
+                                cleaned_scenarios = self._clean_scenario_list(scenarios)
                                 logger.info(f"✅ Fixed JSON parsing successful: {len(cleaned_scenarios)} scenarios")
                                 return cleaned_scenarios
                         except json.JSONDecodeError:
@@ -313,13 +758,12 @@ Requirements:
             
             # Look for JSON-like objects in the text
             # Pattern to match objects that look like scenarios
-            pattern = r'\{[^{}]*"title"[^{}]*\}'
-            matches = re.findall(pattern, text, re.DOTALL)
+            matches = _RE_JSON_LIKE_SCENARIO.findall(text)
             
             for match in matches:
                 try:
                     # Try to parse the individual object
-                    scenario = json.loads(match)
+                    scenario = json_utils.loads(match)
                     if isinstance(scenario, dict) and 'title' in scenario:
                         # Clean the scenario
                         cleaned_scenario = self._validate_and_clean_scenario(scenario)
@@ -342,37 +786,14 @@ Requirements:
         try:
             scenario = {}
             
-            # Extract title
-            title_match = re.search(r'"title"\s*:\s*"([^"]+)"', text)
-            if title_match:
-                scenario['title'] = title_match.group(1).strip()
+            # Extract title/description/severity/priority/automation in a single pass (first match wins)
+            for match in _RE_SCENARIO_FIELD.finditer(text):
+                scenario.setdefault(match.group(1), match.group(2).strip())
             
-            # Extract description
-            desc_match = re.search(r'"description"\s*:\s*"([^"]+)"', text)
-            if desc_match:
-                scenario['description'] = desc_match.group(1).strip()
-            
-            # Extract steps
-            steps_match = re.search(r'"steps"\s*:\s*\[(.*?)\]', text, re.DOTALL)
+            # Extract steps (array value, handled separately)
+            steps_match = _RE_SCENARIO_STEPS.search(text)
             if steps_match:
-                steps_text = steps_match.group(1)
-                steps = re.findall(r'"([^"]+)"', steps_text)
-                scenario['steps'] = steps
-            
-            # Extract severity
-            severity_match = re.search(r'"severity"\s*:\s*"([^"]+)"', text)
-            if severity_match:
-                scenario['severity'] = severity_match.group(1).strip()
-            
-            # Extract priority
-            priority_match = re.search(r'"priority"\s*:\s*"([^"]+)"', text)
-            if priority_match:
-                scenario['priority'] = priority_match.group(1).strip()
-            
-            # Extract automation
-            automation_match = re.search(r'"automation"\s*:\s*"([^"]+)"', text)
-            if automation_match:
-                scenario['automation'] = automation_match.group(1).strip()
+                scenario['steps'] = _RE_QUOTED.findall(steps_match.group(1))
             
             # Only return if we have at least a title
             if scenario.get('title'):
@@ -388,18 +809,18 @@ Requirements:
         """Fix common JSON malformation issues"""
         try:
             # Fix missing commas between objects
-            json_text = re.sub(r'}\s*{', '},{', json_text)
+            json_text = _RE_ADJACENT_OBJECTS.sub('},{', json_text)
             
             # Fix missing commas at end of objects
-            json_text = re.sub(r'"\s*}\s*{', '",},{', json_text)
-            json_text = re.sub(r'"\s*}\s*]', '",}]', json_text)
+            json_text = _RE_QUOTE_OBJECT_GAP.sub('",},{', json_text)
+            json_text = _RE_QUOTE_OBJECT_END.sub('",}]', json_text)
             
             # Fix missing quotes around keys
-            json_text = re.sub(r'(\w+):', r'"\1":', json_text)
+            json_text = _RE_BARE_KEY.sub(r'"\1":', json_text)
             
             # Fix trailing commas
-            json_text = re.sub(r',\s*}', '}', json_text)
-            json_text = re.sub(r',\s*]', ']', json_text)
+            json_text = _RE_TRAILING_COMMA_OBJ.sub('}', json_text)
+            json_text = _RE_TRAILING_COMMA_ARR.sub(']', json_text)
             
             # Fix missing closing brackets
             if json_text.count('[') > json_text.count(']'):
@@ -415,18 +836,29 @@ Requirements:
 
     def _clean_response_text(self, text: str) -> str:
         """Clean response text of markdown and formatting artifacts"""
+        # Fast path: clean JSON responses contain none of the artifacts below
+        if not _RE_NEEDS_CLEANING.search(text):
+            return text.strip()
+        
         # Remove markdown formatting
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # **text** -> text
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)      # *text* -> text
-        text = re.sub(r'^[\+\-\*]\s*', '', text, flags=re.MULTILINE)  # Remove bullet points
-        text = re.sub(r'^\d+\.\s*', '', text, flags=re.MULTILINE)     # Remove numbered lists
+        text = _RE_MD_BOLD.sub(r'\1', text)    # **text** -> text
+        text = _RE_MD_ITALIC.sub(r'\1', text)  # *text* -> text
+        text = _RE_MD_BULLET.sub('', text)     # Remove bullet points
+        text = _RE_MD_NUMBERED.sub('', text)   # Remove numbered lists
         
         # Remove common problematic phrases
-        text = re.sub(r'Here are the.*?scenarios.*?:', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Below are.*?scenarios.*?:', '', text, flags=re.IGNORECASE)
+        text = _RE_PREAMBLE_HERE.sub('', text)
+        text = _RE_PREAMBLE_BELOW.sub('', text)
         
         return text.strip()
 
+    def _clean_scenario_list(self, scenarios: List[Any]) -> List[Dict]:
+        """Validate and clean a parsed scenario array in one pass, dropping rejected entries"""
+        return [
+            cleaned for scenario in scenarios
+            if (cleaned := self._validate_and_clean_scenario(scenario))
+        ]
+
     def _validate_and_clean_scenario(self, scenario: Dict) -> Optional[Dict]:
         """Validate and clean individual scenarios"""
         if not isinstance(scenario, dict):
@@ -439,46 +871,33 @@ Requirements:
             return None
             
         # Skip generic titles
-        generic_titles = ['test scenario', 'scenario', 'test case', 'test']
-        if title.lower() in generic_titles:
+        if title.lower() in self._GENERIC_TITLES:
             return None
             
-        # Clean title of formatting artifacts
-        title = re.sub(r'[\*\+\-]', '', title).strip()
-        title = re.sub(r'^[\d\.\s]+', '', title).strip()  # Remove leading numbers
+        # Ensure steps is a proper list
+        steps = scenario.get('steps', [])
+        if isinstance(steps, str):
+            steps = [steps]
+        elif not isinstance(steps, list):
+            steps = ['1. Execute test steps', '2. Verify expected results']
+        
+        # Strip formatting artifacts from title, description and steps together
+        title, description, clean_steps = _clean_scenario_fields(
+            title, scenario.get('description', '').strip(), steps
+        )
         
         # Ensure title starts with action word
-        action_words = ['verify', 'test', 'check', 'validate', 'ensure', 'confirm']
-        if not any(title.lower().startswith(word) for word in action_words):
-            title = f"Verify {title.lower()}"
+        if not (title_lower := title.lower()).startswith(self._ACTION_WORDS):
+            title = f"Verify {title_lower}"
         
         # Capitalize first letter
         title = title[0].upper() + title[1:] if title else title
         
-        # Clean description
-        description = scenario.get('description', '').strip()
-        description = re.sub(r'[\*\+\-]', '', description).strip()
         if not description:
             description = f"Test scenario for {title.lower()}"
         
-        # Ensure steps is a proper list
-        steps = scenario.get('steps', [])
-        if isinstance(steps, str):
-            steps = [steps]
-        elif not isinstance(steps, list):
-            steps = ['1. Execute test steps', '2. Verify expected results']
-        
-        # Clean steps
-        cleaned_steps = []
-        for step in steps:
-            if isinstance(step, str):
-                clean_step = re.sub(r'[\*\+\-]', '', step).strip()
-                clean_step = re.sub(r'^[\d\.\s]+', '', clean_step).strip()
-                if clean_step and len(clean_step) > 5:
-                    # Ensure step starts with number
-                    if not clean_step[0].isdigit():
-                        clean_step = f"{len(cleaned_steps) + 1}. {clean_step}"
-                    cleaned_steps.append(clean_step)
+        # Renumber the kept steps
+        cleaned_steps = [f"{i}. {step}" for i, step in enumerate(clean_steps, 1)]
         
         if not cleaned_steps:
             cleaned_steps = [
@@ -531,13 +950,13 @@ Requirements:
     def _clean_title_from_line(self, line: str) -> str:
         """Extract and clean title from a line of text"""
         # Remove common prefixes and formatting
-        line = re.sub(r'^[\d\.\s]*', '', line)  # Remove leading numbers
-        line = re.sub(r'[\*\+\-]+', '', line)   # Remove formatting
-        line = re.sub(r'^(title|scenario|test):\s*', '', line, flags=re.IGNORECASE)
+        line = _RE_LEADING_NUMBERING.sub('', line)  # Remove leading numbers
+        line = line.translate(_MARKUP_TABLE)   # Remove formatting
+        line = _RE_TITLE_LABEL.sub('', line)
         
         # Clean quotes and brackets
-        line = re.sub(r'^["\'\[\{]*', '', line)
-        line = re.sub(r'["\'\]\}]*$', '', line)
+        line = _RE_QUOTE_HEAD.sub('', line)
+        line = _RE_QUOTE_TAIL.sub('', line)
         
         return line.strip()
 
@@ -545,7 +964,7 @@ Requirements:
         """Create a high-quality scenario structure"""
         # Clean and improve title
         title = title.strip()
-        if not title.lower().startswith(('verify', 'test', 'check', 'validate', 'ensure')):
+        if not title.lower().startswith(self._ACTION_WORDS):
             title = f"Verify {title.lower()}"
         
         # Capitalize properly
@@ -554,12 +973,7 @@ Requirements:
         return {
             'title': title,
             'description': f"Test scenario to {title.lower()}",
-            'steps': [
-                '1. Navigate to the relevant page or section',
-                '2. Execute the required test actions',
-                '3. Verify the expected outcome occurs',
-                '4. Document the test results'
-            ],
+            'steps': list(self._DEFAULT_STEPS),
             'severity': 'S3 - Moderate',
             'priority': 'P3 - Medium',
             'automation': 'Manual'
@@ -609,7 +1023,7 @@ Requirements:
                 logger.info("No Groq token provided, skipping Groq analysis")
                 return None
                 
-            prompt = self.analysis_prompts['requirement_analysis'].format(
+            prompt = self.requirement_analysis_prompt.format(
                 story_content=story_text[:3000]  # Limit for free tier
             )
             
@@ -627,15 +1041,15 @@ Requirements:
                 'max_tokens': 2000
             }
             
-            response = requests.post(
+            response = self.http.post(
                 self.llm_services['groq']['endpoint'],
                 headers=headers,
-                json=payload,
+                data=json_utils.dumps_bytes(payload),
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = json_utils.loads(response.content)
                 content = result['choices'][0]['message']['content']
                 return self._parse_analysis_response(content)
             else:
@@ -649,24 +1063,19 @@ Requirements:
     def _analyze_with_huggingface(self, story_text: str, verbose: bool = False) -> Optional[Dict]:
         """Analyze requirements using Hugging Face Inference Providers API (NEW FORMAT)"""
         try:
-            hf_token = self.config.get('huggingface', {}).get('token', '')
-            if not hf_token:
+            headers = self._hf_headers
+            if headers is None:
                 logger.info("No Hugging Face token provided, skipping HF analysis")
                 return None
                 
             # Use the NEW Inference Providers API format
-            url = "https://router.huggingface.co/hf-inference/v1/chat/completions"
-            
-            headers = {
-                'Authorization': f'Bearer {hf_token}',
-                'Content-Type': 'application/json'
-            }
+            url = _HF_CHAT_URL
             
             # Use chat completion format for the new API
             prompt = f"Analyze this user story and extract key testing requirements: {story_text[:1000]}"
             
             payload = {
-                'model': 'microsoft/DialoGPT-medium',  # Available model in new API
+                'model': _HF_MODEL,  # Available model in new API
                 'messages': [
                     {'role': 'user', 'content': prompt}
                 ],
@@ -674,10 +1083,10 @@ Requirements:
                 'temperature': 0.3
             }
             
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self.http.post(url, headers=headers, data=json_utils.dumps_bytes(payload), timeout=30)
             
             if response.status_code == 200:
-                result = response.json()
+                result = json_utils.loads(response.content)
                 logger.info(f"✅ HuggingFace Inference Providers API successful: {response.status_code}")
                 
                 # Handle new API response format
@@ -685,9 +1094,10 @@ Requirements:
                     content = result['choices'][0]['message']['content']
                     
                     # Create structured analysis from response
+                    functionality, domain = self._extract_labels_from_text(content)
                     return {
-                        'main_functionality': self._extract_functionality_from_text(content),
-                        'domain': self._extract_domain_from_text(content),
+                        'main_functionality': functionality,
+                        'domain': domain,
                         'complexity': 'medium',
                         'business_rules': self._extract_rules_from_text(content),
                         'integration_points': self._extract_integrations_from_text(content),
@@ -714,7 +1124,7 @@ Requirements:
     def _analyze_with_ollama(self, story_text: str, verbose: bool = False) -> Optional[Dict]:
         """Analyze requirements using local Ollama if available"""
         try:
-            prompt = self.analysis_prompts['requirement_analysis'].format(
+            prompt = self.requirement_analysis_prompt.format(
                 story_content=story_text
             )
             
@@ -728,14 +1138,15 @@ Requirements:
                 }
             }
             
-            response = requests.post(
+            response = self.http.post(
                 self.llm_services['ollama_local']['endpoint'],
-                json=payload,
+                headers=_JSON_HEADERS,
+                data=json_utils.dumps_bytes(payload),
                 timeout=60  # Local processing can take longer
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = json_utils.loads(response.content)
                 generated_text = result.get('response', '')
                 return self._parse_analysis_response(generated_text)
             else:
@@ -753,17 +1164,31 @@ Requirements:
         """Generate comprehensive test scenarios using AI"""
         scenarios = []
         
-        # Generate different types of scenarios
+        # Serialize the analysis once; every prompt embeds the same truncated JSON
+        analysis_str = self._analysis_for_prompt(analysis)
+        
+        # Generate different types of scenarios (label, combined-response key, per-type fallback, its input)
         scenario_types = [
-            ('positive_scenarios', self._generate_positive_scenarios_ai),
-            ('negative_scenarios', self._generate_negative_scenarios_ai),
-            ('edge_cases', self._generate_edge_cases_ai),
-            ('integration_scenarios', self._generate_integration_scenarios_ai)
+            ('positive_scenarios', 'positive', self._generate_positive_scenarios_ai, analysis_str),
+            ('negative_scenarios', 'negative', self._generate_negative_scenarios_ai, analysis_str),
+            ('edge_cases', 'edge_case', self._generate_edge_cases_ai, analysis_str),
+            ('integration_scenarios', 'integration', self._generate_integration_scenarios_ai, analysis)
         ]
         
-        for scenario_type, generator_method in scenario_types:
+        # One Groq round trip for every type; only types it missed go through the per-type calls
+        combined = self._call_groq_for_all_scenario_types(analysis, story, analysis_str)
+        
+        # Issue the remaining type requests at once; total latency becomes the slowest call, not the sum
+        futures = [
+            (scenario_type, combined[type_key] if combined.get(type_key)
+             else self._fanout_executor.submit(generator_method, story, generator_input, verbose))
+            for scenario_type, type_key, generator_method, generator_input in scenario_types
+        ]
+        
+        # Collect in submission order so the scenario ordering stays deterministic
+        for scenario_type, pending in futures:
             try:
-                type_scenarios = generator_method(story, analysis, verbose)
+                type_scenarios = pending if isinstance(pending, list) else pending.result()
                 if type_scenarios:
                     scenarios.extend(type_scenarios)
                     logger.info(f"Generated {len(type_scenarios)} {scenario_type}")
@@ -773,29 +1198,34 @@ Requirements:
         
         return scenarios
 
-    def _generate_positive_scenarios_ai(self, story: Dict, analysis: Dict, verbose: bool = False) -> List[Dict]:
+    def _analysis_for_prompt(self, analysis: Dict) -> str:
+        """Compact JSON of the prompt-relevant analysis fields, capped at 1000 chars"""
+        projected = {key: analysis[key] for key in _ANALYSIS_KEYS_FOR_PROMPT if key in analysis}
+        return json_utils.dumps(projected or analysis)[:1000]
+
+    def _generate_positive_scenarios_ai(self, story: Dict, analysis_str: str, verbose: bool = False) -> List[Dict]:
         """Generate positive/happy path scenarios using AI"""
-        prompt = self.analysis_prompts['scenario_generation'].format(
+        prompt = self.scenario_generation_prompt.format(
             scenario_type="positive happy path",
-            requirement_analysis=json.dumps(analysis, indent=2)[:1000],
+            requirement_analysis=analysis_str,
             story_summary=story.get('fields', {}).get('summary', '')
         )
         
         return self._call_scenario_generation_api(prompt, "positive")
 
-    def _generate_negative_scenarios_ai(self, story: Dict, analysis: Dict, verbose: bool = False) -> List[Dict]:
+    def _generate_negative_scenarios_ai(self, story: Dict, analysis_str: str, verbose: bool = False) -> List[Dict]:
         """Generate negative/error scenarios using AI"""
-        prompt = self.analysis_prompts['negative_testing'].format(
-            requirement_analysis=json.dumps(analysis, indent=2)[:1000],
+        prompt = self.negative_testing_prompt.format(
+            requirement_analysis=analysis_str,
             story_summary=story.get('fields', {}).get('summary', '')
         )
         
         return self._call_scenario_generation_api(prompt, "negative")
 
-    def _generate_edge_cases_ai(self, story: Dict, analysis: Dict, verbose: bool = False) -> List[Dict]:
+    def _generate_edge_cases_ai(self, story: Dict, analysis_str: str, verbose: bool = False) -> List[Dict]:
         """Generate edge case scenarios using AI"""
-        prompt = self.analysis_prompts['edge_case_analysis'].format(
-            requirement_analysis=json.dumps(analysis, indent=2)[:1000],
+        prompt = self.edge_case_prompt.format(
+            requirement_analysis=analysis_str,
             story_summary=story.get('fields', {}).get('summary', '')
         )
         
@@ -820,51 +1250,128 @@ Requirements:
         
         return self._call_scenario_generation_api(prompt, "integration")
 
+    def _scenario_response_key(self, prompt: str, scenario_type: str) -> str:
+        """Cache key for a scenario prompt that ignores whitespace differences only"""
+        normalized = _RE_PROMPT_WHITESPACE.sub(' ', prompt).strip()
+        prompt_hash = hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+        # v2: entries written under the old case/punctuation-folding key are never read back
+        return f"scenarios:v2:{scenario_type}:{prompt_hash}"
+
     def _call_scenario_generation_api(self, prompt: str, scenario_type: str) -> List[Dict]:
         """Call the best available LLM service for scenario generation"""
-        # Try services in order of quality/preference
+        # Identical prompts (re-run stories) reuse the earlier response
+        cache_key = self._scenario_response_key(prompt, scenario_type)
+        cached = self._get_cached_scenarios(cache_key)
+        if cached is not None:
+            logger.info(f"✅ Using cached {scenario_type} scenarios")
+            return json_utils.loads(cached)
+        
+        scenarios = self._request_scenarios_from_services(prompt, scenario_type)
+        if scenarios:
+            self._store_cached_scenarios(cache_key, json_utils.dumps(scenarios))
+        return scenarios
+
+    def _request_scenarios_from_services(self, prompt: str, scenario_type: str) -> List[Dict]:
+        """Race all enabled LLM services; the first response that parses into scenarios wins"""
+        # Services in order of quality/preference
         services = ['groq', 'huggingface', 'ollama_local']
         
-        for service in services:
-            if not self.llm_services[service]['enabled']:
-                continue
-                
-            try:
-                if not self._check_rate_limit(service):
-                    continue
-                    
-                if service == 'groq':
-                    result = self._call_groq_for_scenarios(prompt)
-                elif service == 'huggingface':
-                    result = self._call_hf_for_scenarios(prompt)
-                elif service == 'ollama_local':
-                    result = self._call_ollama_for_scenarios(prompt)
-                else:
-                    continue
-                    
-                if result:
-                    scenarios = self._parse_scenario_response(result, scenario_type)
+        if not self._hedge_requests:
+            # Sequential fallback: a provider is only asked (and charged) once the previous one came back empty
+            for service in services:
+                if (self.llm_services[service]['enabled']
+                        and not self._breaker_open(service)
+                        and self._check_rate_limit(service)):
+                    scenarios = self._call_service_for_scenarios(service, prompt, scenario_type)
                     if scenarios:
                         return scenarios
-                        
-            except Exception as e:
-                logger.warning(f"Error generating {scenario_type} with {service}: {str(e)}")
-                continue
+            return []
+        
+        pending = {
+            self._provider_executor.submit(self._call_service_for_scenarios, service, prompt, scenario_type): service
+            for service in services
+            if self.llm_services[service]['enabled']
+            and not self._breaker_open(service)
+            and self._check_rate_limit(service)
+        }
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                scenarios = future.result()
+                if scenarios:
+                    # Drop the slower providers that have not started yet
+                    for other in pending:
+                        other.cancel()
+                    return scenarios
         
         return []
 
+    def _call_service_for_scenarios(self, service: str, prompt: str, scenario_type: str) -> List[Dict]:
+        """Call one LLM service and parse its response; [] on any failure"""
+        try:
+            if service == 'groq':
+                result = self._call_groq_for_scenarios(prompt)
+            elif service == 'huggingface':
+                result = self._call_hf_for_scenarios(prompt)
+            elif service == 'ollama_local':
+                result = self._call_ollama_for_scenarios(prompt)
+            else:
+                return []
+            
+            self._record_service_result(service, bool(result))
+            if result:
+                return self._parse_scenario_response(result, scenario_type)
+                
+        except Exception as e:
+            self._record_service_result(service, False)
+            logger.warning(f"Error generating {scenario_type} with {service}: {str(e)}")
+        
+        return []
+
+    def _breaker_open(self, service: str) -> bool:
+        """True while a provider is in its cooldown after repeated failures"""
+        with self._breaker_lock:
+            return time.monotonic() < self._breakers[service]['open_until']
+
+    def _record_service_result(self, service: str, success: bool) -> None:
+        """Reset the provider's breaker on success; open it after repeated failures in the window"""
+        with self._breaker_lock:
+            breaker = self._breakers[service]
+            if success:
+                breaker['failures'] = 0
+                return
+            
+            now = time.monotonic()
+            if now - breaker['window_start'] > self._BREAKER_WINDOW_SECONDS:
+                breaker['failures'] = 0
+                breaker['window_start'] = now
+            breaker['failures'] += 1
+            
+            if breaker['failures'] >= self._BREAKER_FAILURE_THRESHOLD:
+                breaker['open_until'] = now + self._BREAKER_COOLDOWN_SECONDS
+                breaker['failures'] = 0
+                logger.warning(f"⚠️ {service} failing repeatedly, skipping it for {self._BREAKER_COOLDOWN_SECONDS}s")
+
     def _enhance_with_specialized_scenarios(self, story: Dict, analysis: Dict, existing_scenarios: List[Dict]) -> List[Dict]:
         """Enhance scenarios with specialized types based on domain"""
         domain = analysis.get('domain', 'general')
         
         # Add domain-specific scenarios
         if domain in ['payment', 'financial']:
-            existing_scenarios.extend(self._generate_security_scenarios(story, analysis))
-            existing_scenarios.extend(self._generate_compliance_scenarios(story, analysis))
+            generators = (self._generate_security_scenarios, self._generate_compliance_scenarios)
         elif domain in ['logistics', 'shipping']:
-            existing_scenarios.extend(self._generate_tracking_scenarios(story, analysis))
+            generators = (self._generate_tracking_scenarios,)
         elif domain in ['user_management', 'authentication']:
-            existing_scenarios.extend(self._generate_auth_scenarios(story, analysis))
+            generators = (self._generate_auth_scenarios,)
+        else:
+            return existing_scenarios
+        
+        # Run the domain generators concurrently; extend in declaration order for stable output
+        futures = [self._fanout_executor.submit(generator, story, analysis) for generator in generators]
+        for future in futures:
+            existing_scenarios.extend(future.result())
         
         return existing_scenarios
 
@@ -875,7 +1382,7 @@ Requirements:
             result = self.fallback_ai.generate_test_scenarios(story, verbose)
             
             if isinstance(result, str):
-                scenarios = json.loads(result)
+                scenarios = json_utils.loads(result)
             else:
                 scenarios = result
                 
@@ -888,6 +1395,8 @@ Requirements:
     def _validate_and_enhance_scenarios(self, scenarios: List[Dict], story: Dict) -> List[Dict]:
         """Validate and enhance generated scenarios for quality"""
         validated_scenarios = []
+        # Journey depends only on the story, so resolve it once rather than per scenario
+        journey = self._determine_journey(story)
         
         for scenario in scenarios:
             # Ensure required fields
@@ -901,7 +1410,7 @@ Requirements:
                 'severity': scenario.get('severity', 'S3 - Moderate'),
                 'priority': scenario.get('priority', 'P3 - Medium'),
                 'automation': scenario.get('automation', 'Manual'),
-                'journey': self._determine_journey(story)
+                'journey': journey
             }
             
             # Ensure steps is a list
@@ -914,39 +1423,41 @@ Requirements:
         return self._remove_duplicate_scenarios(validated_scenarios)
 
     def _remove_duplicate_scenarios(self, scenarios: List[Dict]) -> List[Dict]:
-        """Remove duplicate scenarios based on title similarity"""
+        """Remove duplicate scenarios based on title similarity (word Jaccard > 0.8)"""
         unique_scenarios = []
-        seen_titles = set()
-        
-        for scenario in scenarios:
-            title = scenario.get('title', '').lower().strip()
-            # Simple similarity check
-            is_duplicate = any(
-                self._calculate_similarity(title, seen_title) > 0.8 
-                for seen_title in seen_titles
-            )
-            
-            if not is_duplicate:
+        story_index = _TitleIndex()
+        # Optionally also suppress titles already produced for earlier stories in this run
+        global_index = self._global_title_index if self._dedupe_across_stories else None
+        
+        with self._global_title_lock:
+            for scenario in scenarios:
+                words = _title_tokens(scenario.get('title', ''))
+                if story_index.is_duplicate(words) or (global_index and global_index.is_duplicate(words)):
+                    continue
+                story_index.add(words)
                 unique_scenarios.append(scenario)
-                seen_titles.add(title)
+            
+            if global_index is not None:
+                for scenario in unique_scenarios:
+                    global_index.add(_title_tokens(scenario.get('title', '')))
         
         return unique_scenarios
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts"""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        words1 = _title_tokens(text1)
+        words2 = _title_tokens(text2)
         
         if not words1 or not words2:
             return 0.0
-            
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
         
-        return intersection / union if union > 0 else 0.0
+        # |A ∪ B| = |A| + |B| - |A ∩ B|: one set operation instead of two
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
 
-    # Prompt templates for ChatGPT-level analysis
-    def _get_requirement_analysis_prompt(self) -> str:
+    # Prompt templates for ChatGPT-level analysis (built lazily on first use)
+    @cached_property
+    def requirement_analysis_prompt(self) -> str:
         return """Analyze this user story/requirement comprehensively like a senior QA analyst:
 
 STORY CONTENT:
@@ -973,7 +1484,8 @@ Provide a detailed analysis in JSON format with:
 
 Focus on extracting ALL testable aspects comprehensively."""
 
-    def _get_scenario_generation_prompt(self) -> str:
+    @cached_property
+    def scenario_generation_prompt(self) -> str:
         return """Generate {scenario_type} test scenarios based on this analysis:
 
 REQUIREMENT ANALYSIS:
@@ -1006,7 +1518,8 @@ Requirements:
 - Focus on business value
 - Cover different user paths"""
 
-    def _get_edge_case_prompt(self) -> str:
+    @cached_property
+    def edge_case_prompt(self) -> str:
         return """Identify edge cases and boundary conditions for comprehensive testing:
 
 ANALYSIS: {requirement_analysis}
@@ -1021,7 +1534,8 @@ Generate edge case test scenarios focusing on:
 
 Return JSON array of scenarios with detailed steps."""
 
-    def _get_negative_testing_prompt(self) -> str:
+    @cached_property
+    def negative_testing_prompt(self) -> str:
         return """Generate negative testing scenarios for robust error handling:
 
 ANALYSIS: {requirement_analysis}
@@ -1059,10 +1573,15 @@ Return JSON array focusing on error conditions and system resilience."""
     def _parse_analysis_response(self, response_text: str) -> Optional[Dict]:
         """Parse AI response into structured analysis"""
         try:
-            # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            # Decode the first JSON object in place; trailing prose after it is ignored
+            start = response_text.find('{')
+            if start >= 0:
+                try:
+                    analysis, _ = self._JSON_DECODER.raw_decode(response_text, start)
+                    if isinstance(analysis, dict):
+                        return analysis
+                except json.JSONDecodeError as e:
+                    logger.debug(f"Analysis JSON decoding failed: {e}")
             
             # If no JSON, create structured analysis from text
             return self._text_to_analysis_structure(response_text)
@@ -1073,9 +1592,10 @@ Return JSON array focusing on error conditions and system resilience."""
 
     def _text_to_analysis_structure(self, text: str) -> Dict:
         """Convert text analysis to structured format"""
+        functionality, domain = self._extract_labels_from_text(text)
         return {
-            'main_functionality': self._extract_functionality_from_text(text),
-            'domain': self._extract_domain_from_text(text),
+            'main_functionality': functionality,
+            'domain': domain,
             'complexity': 'medium',
             'business_rules': self._extract_rules_from_text(text),
             'integration_points': self._extract_integrations_from_text(text)
@@ -1107,25 +1627,19 @@ Return JSON array focusing on error conditions and system resilience."""
     def _extract_json_scenarios(self, text: str) -> List[Dict]:
         """Extract JSON scenarios using multiple parsing strategies"""
         # Strategy 1: Find complete JSON array
-        json_array_match = re.search(r'\[[\s\S]*\]', text)
+        json_array_match = _RE_JSON_ARRAY.search(text)
         if json_array_match:
             try:
-                scenarios = json.loads(json_array_match.group())
-                if isinstance(scenarios, list) and len(scenarios) > 0:
-                    return scenarios
+                scenarios = json_utils.loads(json_array_match.group())
+                if isinstance(scenarios, list):
+                    scenarios = [scenario for scenario in scenarios if isinstance(scenario, dict)]
+                    if scenarios:
+                        return scenarios
             except:
                 pass
         
         # Strategy 2: Find multiple JSON objects and combine
-        json_objects = re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text)
-        scenarios = []
-        for obj_str in json_objects:
-            try:
-                obj = json.loads(obj_str)
-                if isinstance(obj, dict) and 'title' in obj:
-                    scenarios.append(obj)
-            except:
-                continue
+        scenarios = [obj for obj in self._iter_json_objects(text) if 'title' in obj]
         
         if scenarios:
             return scenarios
@@ -1148,11 +1662,11 @@ Return JSON array focusing on error conditions and system resilience."""
             try:
                 json_text = ' '.join(json_lines)
                 # Remove common issues
-                json_text = re.sub(r',\s*}', '}', json_text)  # Remove trailing commas
-                json_text = re.sub(r',\s*]', ']', json_text)  # Remove trailing commas
-                scenarios = json.loads(json_text)
+                json_text = _RE_TRAILING_COMMA_OBJ.sub('}', json_text)  # Remove trailing commas
+                json_text = _RE_TRAILING_COMMA_ARR.sub(']', json_text)  # Remove trailing commas
+                scenarios = json_utils.loads(json_text)
                 if isinstance(scenarios, list):
-                    return scenarios
+                    return [scenario for scenario in scenarios if isinstance(scenario, dict)]
                 elif isinstance(scenarios, dict):
                     return [scenarios]
             except:
@@ -1160,6 +1674,20 @@ Return JSON array focusing on error conditions and system resilience."""
         
         return []
 
+    def _iter_json_objects(self, text: str):
+        """Yield each top-level JSON object embedded in text, in one linear scan"""
+        idx = text.find('{')
+        while idx >= 0:
+            try:
+                obj, end = self._JSON_DECODER.raw_decode(text, idx)
+            except ValueError:
+                # Not a valid object here; an inner '{' may still start one
+                idx = text.find('{', idx + 1)
+                continue
+            if isinstance(obj, dict):
+                yield obj
+            idx = text.find('{', end)
+
     def _text_to_scenarios(self, text: str, scenario_type: str) -> List[Dict]:
         """Convert text response to scenario structure"""
         scenarios = []
@@ -1167,24 +1695,11 @@ Return JSON array focusing on error conditions and system resilience."""
         
         current_scenario = None
         
-        for i, line in enumerate(lines):
+        for line in lines:
             line = line.strip()
-            if not line:
-                continue
+            line_kind = self._classify_line(line)
             
-            # Skip JSON artifacts
-            if line in ['{', '}', '[', ']', '},{']:
-                continue
-                
-            # Look for scenario indicators
-            is_scenario_start = any([
-                line.lower().startswith(('title:', 'scenario:', 'test:')),
-                re.match(r'^\d+\.', line) and any(word in line.lower() for word in ['test', 'verify', 'check', 'validate']),
-                '"title"' in line.lower(),
-                (len(line) > 20 and any(word in line.lower() for word in ['test', 'scenario', 'verify', 'validate']) and not line.startswith('-'))
-            ])
-            
-            if is_scenario_start:
+            if line_kind is _LineKind.TITLE:
                 # Save previous scenario
                 if current_scenario and current_scenario.get('title'):
                     scenarios.append(current_scenario)
@@ -1201,13 +1716,13 @@ Return JSON array focusing on error conditions and system resilience."""
                 }
             
             # Look for steps
-            elif current_scenario and self._is_step_line(line):
+            elif current_scenario and line_kind is _LineKind.STEP:
                 step = self._clean_step_text(line)
                 if step and len(step) > 5:  # Only add meaningful steps
                     current_scenario['steps'].append(step)
             
             # Look for description updates
-            elif current_scenario and self._is_description_line(line):
+            elif current_scenario and line_kind is _LineKind.DESC:
                 desc = self._clean_description_text(line)
                 if desc and len(desc) > len(current_scenario.get('description', '')):
                     current_scenario['description'] = desc
@@ -1237,46 +1752,55 @@ Return JSON array focusing on error conditions and system resilience."""
                 break
         
         # Remove quotes and common JSON artifacts
-        line = re.sub(r'^["\'\[\{]*', '', line)
-        line = re.sub(r'["\'\]\},]*$', '', line)
+        line = _RE_QUOTE_HEAD.sub('', line)
+        line = _RE_QUOTE_TAIL_COMMA.sub('', line)
         
         # Limit length
         return line[:100].strip()
 
-    def _is_step_line(self, line: str) -> bool:
-        """Check if line represents a test step"""
-        return any([
-            re.match(r'^\d+\.', line),
-            line.startswith(('-', '*', '•')),
-            '"steps"' in line.lower(),
-            any(word in line.lower() for word in ['step:', 'action:', 'verify:', 'check:'])
-        ])
+    def _classify_line(self, line: str) -> _LineKind:
+        """Classify a stripped response line once: scenario title, step, description, or noise"""
+        if not line or line in self._JSON_ARTIFACT_LINES:
+            return _LineKind.SKIP
+        
+        line_lower = line.lower()
+        numbered = _RE_STEP_NUMBER.match(line) is not None
+        
+        if (line_lower.startswith(self._TITLE_LABELS)
+                or (numbered and _RE_NUMBERED_TITLE_WORDS.search(line_lower))
+                or '"title"' in line_lower
+                or (len(line) > 20 and not line.startswith('-') and _RE_TITLE_WORDS.search(line_lower))):
+            return _LineKind.TITLE
+        
+        if (numbered
+                or line.startswith(self._STEP_MARKERS)
+                or '"steps"' in line_lower
+                or _RE_STEP_LABELS.search(line_lower)):
+            return _LineKind.STEP
+        
+        if 'description' in line_lower or len(line) > 30:
+            return _LineKind.DESC
+        
+        return _LineKind.SKIP
 
     def _clean_step_text(self, line: str) -> str:
         """Clean step text from various formats"""
         # Remove step prefixes
-        line = re.sub(r'^\d+\.\s*', '', line)
-        line = re.sub(r'^[-*•]\s*', '', line)
-        line = re.sub(r'steps?:\s*', '', line, flags=re.IGNORECASE)
+        line = _RE_STEP_NUMBER_PREFIX.sub('', line)
+        line = _RE_BULLET_PREFIX.sub('', line)
+        line = _RE_STEPS_LABEL.sub('', line)
         
         # Remove JSON artifacts
-        line = re.sub(r'^["\'\[\{]*', '', line)
-        line = re.sub(r'["\'\]\},]*$', '', line)
+        line = _RE_QUOTE_HEAD.sub('', line)
+        line = _RE_QUOTE_TAIL_COMMA.sub('', line)
         
         return line.strip()
 
-    def _is_description_line(self, line: str) -> bool:
-        """Check if line contains description"""
-        return any([
-            'description' in line.lower(),
-            len(line) > 30 and not self._is_step_line(line)
-        ])
-
     def _clean_description_text(self, line: str) -> str:
         """Clean description text"""
-        line = re.sub(r'description:\s*', '', line, flags=re.IGNORECASE)
-        line = re.sub(r'^["\'\[\{]*', '', line)
-        line = re.sub(r'["\'\]\},]*$', '', line)
+        line = _RE_DESCRIPTION_LABEL.sub('', line)
+        line = _RE_QUOTE_HEAD.sub('', line)
+        line = _RE_QUOTE_TAIL_COMMA.sub('', line)
         return line.strip()
 
     def _get_default_severity(self, scenario_type: str) -> str:
@@ -1301,23 +1825,13 @@ Return JSON array focusing on error conditions and system resilience."""
 
     def _check_rate_limit(self, service: str) -> bool:
         """Check rate limits for free services"""
-        current_time = time.time()
-        
-        # Reset hourly counters
-        if current_time - self.last_reset_time > 3600:
-            self.request_counts = {}
-            self.last_reset_time = current_time
+        limiter = self._rate_limiters.get(service)
+        if limiter is None:
+            limiter = self._rate_limiters.setdefault(service, _TokenBucket(rate=100, per_seconds=3600))
         
-        service_config = self.llm_services.get(service, {})
-        rate_limit = service_config.get('rate_limit', 100)
-        
-        current_count = self.request_counts.get(service, 0)
-        
-        if current_count >= rate_limit:
+        if not limiter.try_acquire():
             logger.warning(f"Rate limit reached for {service}")
             return False
-            
-        self.request_counts[service] = current_count + 1
         return True
 
     def _determine_journey(self, story: Dict) -> str:
@@ -1355,7 +1869,70 @@ Return JSON array focusing on error conditions and system resilience."""
         return []
 
     # Helper methods for API calls
-    def _call_groq_for_scenarios(self, prompt: str) -> Optional[str]:
+    def _call_groq_for_all_scenario_types(self, analysis: Dict, story: Dict,
+                                          analysis_str: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """
+        BATCHED: Ask Groq for every scenario type in one completion, keyed by type
+        Returns {} when Groq is unavailable or the combined response cannot be parsed
+        """
+        if not self.llm_services['groq']['enabled'] or not self.config.get('groq_token', ''):
+            return {}
+        if self._breaker_open('groq') or not self._check_rate_limit('groq'):
+            return {}
+        
+        if analysis_str is None:
+            analysis_str = self._analysis_for_prompt(analysis)
+        integration_points = analysis.get('integration_points', [])
+        sections = [
+            'positive: 3-5 positive happy path scenarios covering different user paths',
+            'negative: 3-5 scenarios for invalid inputs, auth failures, system errors, timeouts and missing data',
+            'edge_case: 3-5 scenarios for boundary values, unusual data combinations, system limits and concurrent users'
+        ]
+        if integration_points:
+            sections.append(
+                f"integration: 2-3 scenarios for data flow and error handling between {', '.join(integration_points)}"
+            )
+        section_lines = '\n'.join(f"- {section}" for section in sections)
+        
+        prompt = f"""Generate test scenarios based on this analysis:
+
+REQUIREMENT ANALYSIS:
+{analysis_str}
+
+STORY: {story.get('fields', {}).get('summary', '')}
+
+Generate these sections:
+{section_lines}
+
+Each scenario uses this format:
+{{"title": "Clear, descriptive test scenario title", "description": "Detailed description of what this scenario tests", "steps": ["1. Specific step with clear action", "2. Verification step with expected result"], "severity": "S1 - Critical", "priority": "P1 - Critical", "automation": "Manual"}}
+
+IMPORTANT: Return ONLY a JSON object mapping each section name to its array of scenarios, e.g. {{"positive": [...], "negative": [...]}}"""
+        
+        content = self._call_groq_for_scenarios(prompt, max_tokens=4000)
+        combined = None
+        if content:
+            start, end = content.find('{'), content.rfind('}')
+            try:
+                if 0 <= start < end:
+                    combined = json_utils.loads(content[start:end + 1])
+            except ValueError:
+                logger.warning("Combined Groq scenario response was not valid JSON, using per-type calls")
+        if not isinstance(combined, dict):
+            self._record_service_result('groq', False)
+            return {}
+        
+        # Same validation as the per-type path, so a story's scenarios don't depend on which path answered
+        scenarios_by_type = {
+            scenario_type: self._clean_scenario_list(scenarios)
+            for scenario_type, scenarios in combined.items() if isinstance(scenarios, list)
+        }
+        self._record_service_result('groq', any(scenarios_by_type.values()))
+        
+        logger.info(f"✅ Groq combined generation returned {len(scenarios_by_type)} scenario types")
+        return scenarios_by_type
+
+    def _call_groq_for_scenarios(self, prompt: str, max_tokens: int = 1500) -> Optional[str]:
         """Call Groq API for scenario generation"""
         try:
             groq_token = self.config.get('groq_token', '')
@@ -1373,29 +1950,34 @@ Return JSON array focusing on error conditions and system resilience."""
                     {'role': 'user', 'content': prompt}
                 ],
                 'temperature': 0.3,
-                'max_tokens': 1500
+                'max_tokens': max_tokens,
+                'stream': True  # Start receiving tokens immediately; stop once the JSON is complete
             }
             
-            response = requests.post(
+            cache_key = self.llm_cache.cache_key(payload['model'], payload['messages'], payload['temperature'], max_tokens)
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            with self.http.post(
                 'https://api.groq.com/openai/v1/chat/completions',
                 headers=headers,
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content']
-                
-                # Debug logging to see what we're getting
-                logger.debug(f"🔍 Groq response preview: {content[:200]}...")
-                logger.debug(f"🔍 Groq response length: {len(content)} characters")
-                
-                logger.info(f"✅ Groq scenario generation successful")
-                return content
-            else:
-                logger.error(f"Groq scenario API error: {response.status_code} - {response.text[:100]}")
-                return None
+                data=json_utils.dumps_bytes(payload),
+                timeout=30,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(f"Groq scenario API error: {response.status_code} - {response.text[:100]}")
+                    return None
+                content = _read_until_json_complete(_iter_sse_content(response))
+            
+            # Debug logging to see what we're getting
+            logger.debug(f"🔍 Groq response preview: {content[:200]}...")
+            logger.debug(f"🔍 Groq response length: {len(content)} characters")
+            
+            logger.info(f"✅ Groq scenario generation successful")
+            self.llm_cache.set(cache_key, content)
+            return content
                 
         except Exception as e:
             logger.error(f"Groq scenario generation error: {str(e)}")
@@ -1404,71 +1986,94 @@ Return JSON array focusing on error conditions and system resilience."""
     def _call_hf_for_scenarios(self, prompt: str) -> Optional[str]:
         """Call HuggingFace Inference Providers API for scenario generation (NEW FORMAT)"""
         try:
-            hf_token = self.config.get('huggingface', {}).get('token', '')
-            if not hf_token:
+            headers = self._hf_headers
+            if headers is None:
                 return None
                 
             # Use the NEW Inference Providers API
-            url = "https://router.huggingface.co/hf-inference/v1/chat/completions"
-            
-            headers = {
-                'Authorization': f'Bearer {hf_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Format prompt for chat completion
-            formatted_prompt = f"Generate test scenarios based on: {prompt[:800]}\n\nReturn 3-5 test scenarios in JSON format."
+            url = _HF_CHAT_URL
             
+            # Static instruction first, ticket text last; the instruction no longer shares the user budget
             payload = {
-                'model': 'microsoft/DialoGPT-medium',
+                'model': _HF_MODEL,
                 'messages': [
-                    {'role': 'user', 'content': formatted_prompt}
+                    _HF_SYSTEM_MESSAGE,
+                    {'role': 'user', 'content': truncate_to_tokens(prompt, self._HF_PROMPT_TOKENS)}
                 ],
                 'max_tokens': 500,
                 'temperature': 0.4
             }
             
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            # Keyed on the exact request; None (uncached) while the temperature is above the cacheable limit
+            cache_key = self.llm_cache.cache_key(payload['model'], payload['messages'], payload['temperature'], payload['max_tokens'])
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Stream deltas and stop once the JSON array closes; providers without SSE reply with one JSON body
+            started = time.monotonic()
+            with self.http.post(url, headers=headers, data=json_utils.dumps_bytes({**payload, 'stream': True}), timeout=self._hf_timeout(), stream=True) as response:
+                if response.status_code != 200:
+                    logger.error("HuggingFace Providers scenario API error: {}", response.status_code)
+                    return None
+                if response.headers.get('Content-Type', '').startswith('text/event-stream'):
+                    content = _read_until_json_complete(_iter_sse_content(response))
+                else:
+                    choices = json_utils.loads(response.content).get('choices') or []
+                    content = choices[0]['message']['content'] if choices else ''
             
-            if response.status_code == 200:
-                result = response.json()
-                if 'choices' in result and len(result['choices']) > 0:
-                    content = result['choices'][0]['message']['content']
-                    logger.info(f"✅ HuggingFace Providers scenario generation successful")
-                    return content
-            else:
-                logger.error(f"HuggingFace Providers scenario API error: {response.status_code}")
-                
+            if not content:
+                return None
+            self._hf_latencies.append(time.monotonic() - started)
+            logger.info("✅ HuggingFace Providers scenario generation successful")
+            self.llm_cache.set(cache_key, content)
+            return content
+            
+        except requests.RequestException as e:
+            # Timeouts/resets already went through the session's Retry backoff; report which one gave out
+            logger.warning("HuggingFace Providers scenario request failed ({}): {}", type(e).__name__, e)
             return None
-            
         except Exception as e:
-            logger.error(f"HuggingFace Providers scenario generation error: {str(e)}")
+            logger.error("HuggingFace Providers scenario generation error: {}", e)
             return None
 
+    @cached_property
+    def _hf_headers(self) -> Optional[Dict[str, str]]:
+        """HF request headers, built once from the configured token (None when no token is set)"""
+        hf_token = self.config.get('huggingface', {}).get('token', '')
+        if not hf_token:
+            return None
+        return {
+            'Authorization': f'Bearer {hf_token}',
+            'Content-Type': 'application/json'
+        }
+
+    def _hf_timeout(self) -> float:
+        """Request timeout for HF: p99 of recent successful latencies x 1.5, or the default until enough samples exist"""
+        samples = list(self._hf_latencies)
+        if len(samples) < self._HF_MIN_LATENCY_SAMPLES:
+            return self._HF_DEFAULT_TIMEOUT
+        p99 = statistics.quantiles(samples, n=100)[98]
+        return min(self._HF_DEFAULT_TIMEOUT, max(self._HF_MIN_TIMEOUT, p99 * 1.5))
+
     def _call_ollama_for_scenarios(self, prompt: str) -> Optional[str]:
         """Call Ollama local API for scenario generation"""
         # Implementation similar to _analyze_with_ollama
         return None
 
-    # Text extraction helper methods (minimal but non-stub defaults)
+    # Text extraction helper methods (minimal but non-stub defaults); scans are memoized per distinct text
+    def _extract_labels_from_text(self, text: str) -> Tuple[str, str]:
+        """(functionality, domain) from one lowered copy of the text"""
+        return _text_labels(text or "")
+
     def _extract_functionality_from_text(self, text: str) -> str:
-        text_lower = (text or "").lower()
-        if any(k in text_lower for k in ["payment", "checkout", "invoice", "transaction"]):
-            return "Payments"
-        if any(k in text_lower for k in ["login", "authentication", "register", "user"]):
-            return "User Management"
-        return "General"
+        return _text_labels(text or "")[0]
 
     def _extract_domain_from_text(self, text: str) -> str:
-        text_lower = (text or "").lower()
-        if any(k in text_lower for k in ["finance", "billing", "revenue", "cost"]):
-            return "Finance"
-        if any(k in text_lower for k in ["logistics", "shipping", "warehouse", "inventory"]):
-            return "Logistics"
-        return "General"
+        return _text_labels(text or "")[1]
 
     def _extract_rules_from_text(self, text: str) -> List[str]:
-        return []
+        return list(_text_rules(text or ''))  # Fresh list: callers own the analysis they build
 
     def _extract_integrations_from_text(self, text: str) -> List[str]:
-        return []
\ No newline at end of file
+        return list(_text_integrations(text or ''))
@@ -1,50 +1,149 @@
 import requests
-import json
+import urllib3
 import base64
 import re
 import sys
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from urllib.parse import quote
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import random
+import threading
+from typing import ClassVar, Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps, lru_cache
 
 from loguru import logger
-from rich.console import Console
-from rich.theme import Theme
 
+from app.utils import json_utils
 from app.utils.field_mappings import FieldMappings, field_mappings
 from app.clients.api_client import APIClient
 from app.validators.field_validators import FieldValidator
 from app.formatters.response_formatter import ResponseFormatter
 
-# Configure custom theme for rich (singleton pattern)
-_console_theme = Theme({
-    "info": "cyan",
-    "warning": "yellow", 
-    "error": "red",
-    "success": "green"
-})
-console = Console(theme=_console_theme)
+@lru_cache(maxsize=1)
+def _console():
+    """Rich console with the custom theme, created on first status message (keeps rich off the import path)"""
+    from rich.console import Console
+    from rich.theme import Theme
+    return Console(theme=Theme({
+        "info": "cyan",
+        "warning": "yellow",
+        "error": "red",
+        "success": "green"
+    }))
 
 # Configure logger once
 logger.remove()
 logger.add(sys.stderr, level="INFO", format="<level>{level}</level> | {message}", colorize=True)
 
-def retry_on_failure(max_retries=3, delay=1):
-    """Decorator to retry failed API calls"""
+def _is_transient(error: Exception) -> bool:
+    """
+    Network failures and server errors are worth retrying; client errors are not
+    429 is excluded: JiraClient._send already waits out Retry-After and resends throttled requests
+    """
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500
+    return False
+
+def _never_sent(error: Exception) -> bool:
+    """
+    Failures where the request cannot have reached Jira: the only errors safe to retry for a create
+    A read timeout, dropped response or 5xx may follow an issue Jira already created, so those are not
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        # Refused connections and DNS failures arrive wrapped in urllib3's MaxRetryError
+        reason = getattr(error.args[0], 'reason', error.args[0])
+        return isinstance(reason, urllib3.exceptions.NewConnectionError)
+    return False
+
+def retry_on_failure(max_retries=3, delay=1, retry_if=_is_transient):
+    """
+    Decorator to retry failed API calls with exponential backoff and jitter
+    retry_if picks the retryable errors: transient ones by default, _never_sent for non-idempotent creates
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"Failed to execute: {str(e)}")
-                raise
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_retries - 1 or not retry_if(e):
+                        logger.error(f"Failed to execute: {str(e)}")
+                        raise
+                    wait = delay * (2 ** attempt) + random.uniform(0, 0.1)
+                    logger.warning(f"Transient error in {func.__name__} ({str(e)}), retrying in {wait:.1f}s")
+                    time.sleep(wait)
         return wrapper
     return decorator
 
+_WS_RE = re.compile(r'\s+')
+
+# Projects whose test cases carry the automation status / journey custom fields
+_AUTOMATION_STATUS_PROJECTS = frozenset({'MBA', 'PLA', 'PU'})
+_JOURNEY_PROJECTS = frozenset({'MBA', 'PLA', 'LFT', 'PU'})
+
+@lru_cache(maxsize=1)
+def _journey_map() -> Dict[str, Any]:
+    """Direct mapping of project to journey, built once from the global field_mappings"""
+    return {
+        'PLA': field_mappings.get_journey('Seller Management'),  # Platform
+        'MBA': field_mappings.get_journey('Buyer Management'),   # My Business Account
+        'SEL': field_mappings.get_journey('Seller Management'),  # Seller
+        'RFQ': field_mappings.get_journey('RFQ'),               # RFQ
+        'BCK': field_mappings.get_journey('Backoffice'),        # Backoffice
+        'ENT': field_mappings.get_journey('Enterprise'),        # Enterprise
+        'PU': field_mappings.get_journey('Purchase'),           # Purchasing
+        'FIN': field_mappings.get_journey('Account'),           # Finance
+        'CMS': field_mappings.get_journey('Account'),           # Content Management
+        'API': field_mappings.get_journey('Account'),           # API Management
+        'SEC': field_mappings.get_journey('Account'),           # Security
+        'OPS': field_mappings.get_journey('Account'),           # Operations
+        'CRM': field_mappings.get_journey('Account'),           # Customer Relationship Management
+        'LOG': field_mappings.get_journey('Account'),           # Logistics
+        'PAY': field_mappings.get_journey('Account'),           # Payments
+        'INV': field_mappings.get_journey('Account'),           # Inventory
+        'REP': field_mappings.get_journey('Account')            # Reporting
+    }
+
+@lru_cache(maxsize=8)
+def _build_auth_header(email: str, api_token: str) -> Dict[str, str]:
+    """Basic-auth JSON headers, encoded once per set of credentials"""
+    auth_b64 = base64.b64encode(f"{email}:{api_token}".encode('ascii')).decode('ascii')
+    return {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+        'Authorization': f'Basic {auth_b64}'
+    }
+
 class JiraClient:
+    # Fixed attribute set: no per-instance __dict__, and the hot self.session/self._cache reads use slot descriptors
+    __slots__ = (
+        'config', 'base_url', 'email', 'api_token', 'headers', 'field_mappings', 'api_client',
+        'validator', 'formatter', 'quiet_mode', '_cache', 'executor', 'session',
+        '_semaphore', '_rate_limit_reset', 'response_listener'
+    )
+
+    # Journey option IDs by journey name
+    _JOURNEY_MAPPING: ClassVar[Dict[str, str]] = {
+        'Account': '10054',
+        'Buyer Management': '10059',
+        'Seller Management': '10060',
+        'RFQ': '10441',
+        'Backoffice': '10068',
+        'Enterprise': '10440',
+        'Purchase': '10439',
+        'Discovery': '10063',
+        'Catalogue': '10069'
+    }
+
+    # Concurrent raw REST calls per client (keeps bursts under Jira Cloud's per-tenant rate limit)
+    _MAX_CONCURRENT_REQUESTS = 5
+    # Resends of a throttled (429) request before the 429 is returned to the caller
+    _RATE_LIMIT_RETRIES = 3
+
     def __init__(self, config):
         """Initialize Jira client with configuration"""
         self.config = config
@@ -57,7 +156,8 @@ class JiraClient:
         
         # Initialize utilities
         self.field_mappings = FieldMappings()
-        self.api_client = APIClient(self.base_url, self.headers)
+        # APIClient requests go through _send too, so one gate owns 429 handling for every Jira call
+        self.api_client = APIClient(self.base_url, self.headers, send=self._send)
         self.validator = FieldValidator()
         self.formatter = ResponseFormatter()
         
@@ -74,23 +174,68 @@ class JiraClient:
             'field_metadata': {},
             'current_user': None,
             'create_meta': {},
-            'test_type': {}
+            'field_config': {}
         }
         
         # Initialize thread pool executor
         self.executor = ThreadPoolExecutor(max_workers=5)
+        
+        # Reuse the API client's pooled keep-alive session (auth headers already set) for raw REST calls
+        self.session = self.api_client.session
+        
+        # Shared request gate: at most _MAX_CONCURRENT_REQUESTS in flight, all paused while Jira's Retry-After runs
+        self._semaphore = threading.Semaphore(self._MAX_CONCURRENT_REQUESTS)
+        self._rate_limit_reset = 0.0
+        # Optional callable given every response as it arrives, 429s included (e.g. an adaptive concurrency limit)
+        self.response_listener = None
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Session request behind the concurrency gate
+        A 429 pauses every caller for the server's Retry-After and the request is resent, up to
+        _RATE_LIMIT_RETRIES times; the last 429 is handed back if Jira is still throttling.
+        This is the only 429 retry layer: the session adapter retries server errors only
+        """
+        for attempt in range(self._RATE_LIMIT_RETRIES + 1):
+            with self._semaphore:
+                wait = self._rate_limit_reset - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                response = self.session.request(method, url, timeout=self.api_client.default_timeout, **kwargs)
+                if self.response_listener is not None:
+                    self.response_listener(response)
+                if response.status_code != 429 or attempt == self._RATE_LIMIT_RETRIES:
+                    return response
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 0))
+                except ValueError:  # HTTP-date form
+                    retry_after = 0.0
+                if retry_after <= 0:  # No usable header: exponential backoff instead
+                    retry_after = 2 ** attempt
+                self._rate_limit_reset = max(self._rate_limit_reset, time.monotonic() + retry_after)
+                logger.warning(f"Jira rate limit hit, pausing requests for {retry_after:g}s and retrying")
+        return response
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Hard cap on this client's in-flight requests; callers fanning out beyond it only queue"""
+        return self._MAX_CONCURRENT_REQUESTS
+
+    def close(self):
+        """Release pooled connections and worker threads"""
+        self.session.close()
+        self.executor.shutdown(wait=False)
+    
+    def __del__(self):
+        """Cleanup on object destruction"""
+        try:
+            self.close()
+        except Exception:
+            pass  # Interpreter shutdown or partially initialized client
     
     def _setup_authentication(self) -> Dict[str, str]:
-        """Set up authentication headers in one step"""
-        auth_string = f"{self.email}:{self.api_token}"
-        auth_bytes = auth_string.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        return {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'Authorization': f'Basic {auth_b64}'
-        }
+        """Set up authentication headers in one step (a copy: the cached dict is shared across clients)"""
+        return _build_auth_header(self.email, self.api_token).copy()
 
     def test_connection(self):
         """Test Jira connection and return user info"""
@@ -100,29 +245,42 @@ class JiraClient:
         """Get issue details from Jira"""
         FieldValidator.validate_issue_key(issue_key)
         try:
-            logger.debug(f"Fetching issue details for {issue_key}")
+            logger.debug("Fetching issue details for {}", issue_key)
             data = self.api_client.get(f'rest/api/3/issue/{issue_key}')
-            logger.debug(f"Got issue data for {issue_key}: {data.get('key')} ({data.get('fields', {}).get('issuetype', {}).get('name')})")
+            logger.opt(lazy=True).debug(
+                "Got issue data for {}: {} ({})",
+                lambda: issue_key, lambda: data.get('key'), lambda: data.get('fields', {}).get('issuetype', {}).get('name')
+            )
             return data
         except Exception as e:
             logger.error(f"Error fetching issue {issue_key}: {str(e)}")
             return None
 
-    @retry_on_failure(max_retries=3, delay=1)
+    @retry_on_failure(max_retries=3, delay=1, retry_if=_never_sent)
     def create_issue(self, fields, project_key=None):
-        """Create a new issue in Jira with retry logic"""
+        """Create a new issue in Jira, retried only when the request never reached the server"""
         if project_key and 'project' not in fields:
             fields['project'] = {'key': project_key}
         return self.api_client.post('rest/api/3/issue', {'fields': fields})
 
-    @lru_cache(maxsize=50)
     def get_issue_types(self, project_key):
         """Get available issue types for a project with enhanced caching"""
+        return self._issue_type_cache(project_key)['list']
+
+    def get_issue_type(self, project_key, name):
+        """Issue type by name from the cached name index (None when the project has no such type)"""
+        return self._issue_type_cache(project_key)['by_name'].get(name)
+
+    def _issue_type_cache(self, project_key):
+        """Cached issue types as the raw list plus a name index (first type wins for duplicate names)"""
         if project_key not in self._cache['issue_types']:
-            self._cache['issue_types'][project_key] = self.api_client.get('rest/api/3/issuetype')
+            issue_types = self.api_client.get('rest/api/3/issuetype') or []
+            by_name = {}
+            for issue_type in issue_types:
+                by_name.setdefault(issue_type['name'], issue_type)
+            self._cache['issue_types'][project_key] = {'list': issue_types, 'by_name': by_name}
         return self._cache['issue_types'][project_key]
 
-    @lru_cache(maxsize=100)
     def get_create_meta(self, project_key, issue_type_id):
         """Get create metadata for issue type with enhanced caching and error handling"""
         cache_key = f"{project_key}_{issue_type_id}"
@@ -178,13 +336,13 @@ class JiraClient:
         }
 
     @staticmethod
-    @lru_cache(maxsize=500)
+    @lru_cache(maxsize=2048)
     def _clean_title(title: str) -> str:
         """Clean up title by removing newlines and extra whitespace with caching"""
         if not title:
             return ""
-        # Replace newlines with spaces and remove extra whitespace
-        cleaned = ' '.join(title.replace('\n', ' ').split())
+        # Collapse newlines and whitespace runs to single spaces in one pass
+        cleaned = _WS_RE.sub(' ', title).strip()
         # Truncate if too long (Jira has a 255 character limit)
         if len(cleaned) > 255:
             cleaned = cleaned[:252] + "..."
@@ -199,91 +357,106 @@ class JiraClient:
             # Validate project field configuration first
             field_config = self.validate_project_fields(project_key)
             
-            # Create each test case
-            created_tests = []
+            # Build every issue up front; a malformed scenario is skipped like a failed create
+            # The project/issue type refs are read-only, so every issue in the bulk payload shares one dict
+            project_ref = {'key': project_key}
+            issuetype_ref = {'id': field_config['test_type_id']}
+            prepared = []
             for scenario in scenarios:
                 try:
-                    # Base fields that are common to all projects
-                    fields = {
-                        'project': {'key': project_key},
-                        'summary': self._clean_title(scenario['title']),
-                        'description': self._format_description(scenario['description']),
-                        'issuetype': {'id': field_config['test_type_id']},
-                        'assignee': {'accountId': scenario['assignee_id']}  # Set assignee from scenario
-                    }
-
-                    # Add severity if available
-                    if field_config['has_severity']:
-                        fields['customfield_10031'] = {'value': scenario.get('severity', 'S3 - Moderate')}
-
-                    # Add automation status only if field is available and project needs it
-                    if field_config['has_automation_status'] and project_key in ['MBA', 'PLA', 'PU']:
-                        fields['customfield_10064'] = {'value': scenario.get('automation_status', 'Manual')}
-
-                    # Add journey only if field is available and project needs it
-                    if field_config['has_journey'] and project_key in ['MBA', 'PLA', 'LFT', 'PU']:
-                        fields['customfield_10037'] = {'id': self._get_journey_id(scenario.get('journey', 'Account'))}
-                    
-                    # Create test case
-                    response = self.create_issue(fields, project_key)
-                    test_key = response['key']
-                    
-                    # Link to story
-                    self.create_link(test_key, story_key)
-                    
-                    created_tests.append({
-                        'key': test_key,
-                        'title': scenario['title'],
-                        'linked': True
-                    })
-                    
+                    prepared.append((scenario, self._scenario_fields(scenario, project_key, field_config, project_ref, issuetype_ref)))
                 except Exception as e:
                     logger.error(f"Failed to create test case: {str(e)}")
-                    continue
             
-            return created_tests
+            # Create in concurrent bulk batches, then link the created issues concurrently
+            keys = self._async_batch_create([fields for _, fields in prepared])
+            created_tests = [
+                {'key': key, 'title': scenario['title'], 'linked': False}
+                for (scenario, _), key in zip(prepared, keys)
+                if key
+            ]
+            return self._bulk_create_links(created_tests, story_key)
             
         except Exception as e:
             logger.error(f"Error in create_test_cases_for_story: {str(e)}")
             return []
 
+    def _scenario_fields(self, scenario: Dict, project_key: str, field_config: Dict,
+                         project_ref: Dict, issuetype_ref: Dict) -> Dict:
+        """Issue fields for one test case from a scenario (project_ref/issuetype_ref are shared, never mutated)"""
+        # Base fields that are common to all projects
+        fields = {
+            'project': project_ref,
+            'summary': self._clean_title(scenario['title']),
+            'description': self._format_description(scenario['description']),
+            'issuetype': issuetype_ref,
+            'assignee': {'accountId': scenario['assignee_id']}  # Set assignee from scenario
+        }
+
+        # Add severity if available
+        if field_config['has_severity']:
+            fields['customfield_10031'] = {'value': scenario.get('severity', 'S3 - Moderate')}
+
+        # Add automation status only if field is available and project needs it
+        if field_config['has_automation_status'] and project_key in _AUTOMATION_STATUS_PROJECTS:
+            fields['customfield_10064'] = {'value': scenario.get('automation_status', 'Manual')}
+
+        # Add journey only if field is available and project needs it
+        if field_config['has_journey'] and project_key in _JOURNEY_PROJECTS:
+            fields['customfield_10037'] = {'id': self._get_journey_id(scenario.get('journey', 'Account'))}
+        
+        return fields
+
+    def _async_batch_create(self, issue_fields: List[Dict], batch_size: int = 10) -> List[Optional[str]]:
+        """
+        Create issues through /issue/bulk in batches of batch_size, submitted concurrently
+        Returns the created keys aligned with issue_fields (None where creation failed)
+        """
+        batches = [issue_fields[start:start + batch_size] for start in range(0, len(issue_fields), batch_size)]
+        futures = [self.executor.submit(self._bulk_create_issues, batch) for batch in batches]
+        keys = []
+        for batch, future in zip(batches, futures):
+            try:
+                keys.extend(future.result())
+            except Exception as e:
+                logger.error(f"Failed to create test case batch (not resent; check Jira for partial creates): {str(e)}")
+                keys.extend([None] * len(batch))
+        return keys
+
+    @retry_on_failure(max_retries=3, delay=1, retry_if=_never_sent)
+    def _bulk_create_issues(self, issue_fields: List[Dict]) -> List[Optional[str]]:
+        """
+        One /issue/bulk request; created keys aligned with issue_fields (None for rejected entries)
+        Bulk create is not atomic, so a batch is only resent when it never reached Jira
+        """
+        response = self._send(
+            'POST',
+            f"{self.base_url}/rest/api/3/issue/bulk",
+            data=json_utils.dumps_bytes({'issueUpdates': [{'fields': fields} for fields in issue_fields]})
+        )
+        # Server errors and a 429 _send gave up on fail the batch: part of it may already exist in Jira
+        if response.status_code == 429 or response.status_code >= 500:
+            response.raise_for_status()
+        result = json_utils.loads(response.content) if response.content else {}
+        if response.status_code not in (200, 201) and not result.get('issues'):
+            raise Exception(f"Bulk create failed ({response.status_code}): {result.get('errors') or response.text}")
+        
+        # Jira lists created issues in request order and reports rejected entries by index
+        failed = {error.get('failedElementNumber') for error in result.get('errors', [])}
+        for error in result.get('errors', []):
+            logger.error(f"Failed to create test case: {error.get('elementErrors')}")
+        created = iter(result.get('issues', []))
+        return [None if index in failed else next(created, {}).get('key') for index in range(len(issue_fields))]
+
     def _get_test_type(self, project_key):
         """Get Test Scenario type with caching"""
-        if project_key not in self._cache['test_type']:
-            issue_types = self.get_issue_types(project_key)
-            self._cache['test_type'][project_key] = next(
-                (t for t in issue_types if t['name'] == 'Test Scenario'),
-                None
-            )
-        return self._cache['test_type'][project_key]
+        return self.get_issue_type(project_key, 'Test Scenario')
 
     def _determine_journey_type(self, story):
         """Determine journey type based on project key"""
         fields = story.get('fields', {})
         project_key = fields.get('project', {}).get('key', '')
-        
-        # Direct mapping of project to journey - use global field_mappings
-        journey_map = {
-            'PLA': field_mappings.get_journey('Seller Management'),  # Platform
-            'MBA': field_mappings.get_journey('Buyer Management'),   # My Business Account
-            'SEL': field_mappings.get_journey('Seller Management'),  # Seller
-            'RFQ': field_mappings.get_journey('RFQ'),               # RFQ
-            'BCK': field_mappings.get_journey('Backoffice'),        # Backoffice
-            'ENT': field_mappings.get_journey('Enterprise'),        # Enterprise
-            'PU': field_mappings.get_journey('Purchase'),           # Purchasing
-            'FIN': field_mappings.get_journey('Account'),           # Finance
-            'CMS': field_mappings.get_journey('Account'),           # Content Management
-            'API': field_mappings.get_journey('Account'),           # API Management
-            'SEC': field_mappings.get_journey('Account'),           # Security
-            'OPS': field_mappings.get_journey('Account'),           # Operations
-            'CRM': field_mappings.get_journey('Account'),           # Customer Relationship Management
-            'LOG': field_mappings.get_journey('Account'),           # Logistics
-            'PAY': field_mappings.get_journey('Account'),           # Payments
-            'INV': field_mappings.get_journey('Account'),           # Inventory
-            'REP': field_mappings.get_journey('Account')            # Reporting
-        }
-        
-        return journey_map.get(project_key, field_mappings.get_journey('Account'))  # Default to Account journey
+        return _journey_map().get(project_key, field_mappings.get_journey('Account'))  # Default to Account journey
 
     def _print_status(self, message: str, status: str = "info"):
         """Print status message with appropriate styling"""
@@ -294,17 +467,18 @@ class JiraClient:
             "error": "❌"
         }
         icon = status_icons.get(status, "•")
-        console.print(f"{icon} {message}", style=status)
+        _console().print(f"{icon} {message}", style=status)
 
     def validate_project_fields(self, project_key: str, quiet: bool = False) -> Dict:
-        """Validate project field configuration before creating test cases"""
+        """Validate project field configuration before creating test cases (resolved once per project)"""
+        if project_key in self._cache['field_config']:
+            return self._cache['field_config'][project_key]
         try:
             # Get issue type ID for Test Scenario
-            issue_types = self.get_issue_types(project_key)
-            test_type = next((t for t in issue_types if t['name'] == 'Test Scenario'), None)
+            test_type = self._get_test_type(project_key)
             if not test_type:
                 # List available issue types for debugging
-                available_types = [t['name'] for t in issue_types] if issue_types else []
+                available_types = list(self._issue_type_cache(project_key)['by_name'])
                 raise Exception(
                     f"Test Scenario issue type not found in project {project_key}. "
                     f"Available issue types: {', '.join(available_types) if available_types else 'None'}"
@@ -328,85 +502,33 @@ class JiraClient:
                 logger.info(f"- Journey: {'✓' if field_config['has_journey'] else '✗'}")
                 logger.info(f"- Severity: {'✓' if field_config['has_severity'] else '✗'}")
 
+            self._cache['field_config'][project_key] = field_config
             return field_config
 
         except Exception as e:
             logger.error(f"Error validating project fields: {str(e)}")
             raise
 
-    def _bulk_create_test_cases(self, project_key: str, test_cases: List[Dict], story_key: str) -> List[Dict]:
-        """Create test cases in bulk"""
-        try:
-            # Get issue type ID for "Test Scenario"
-            issue_types = self.get_issue_types(project_key)
-            test_type = next((t for t in issue_types if t['name'] == 'Test Scenario'), None)
-            if not test_type:
-                raise Exception("Test Scenario issue type not found")
-
-            # Prepare bulk create payload
-            bulk_payload = {
-                "issueUpdates": [
-                    {
-                        "fields": {
-                            "project": {"key": project_key},
-                            "summary": test_case['title'][:255],
-                            "description": self._format_description(test_case['description']),
-                            "issuetype": {"id": test_type['id']},
-                            **({"customfield_10031": {"value": test_case['severity']}} if 'severity' in test_case else {}),
-                            **({"customfield_10064": {"value": test_case['automation']}} if 'automation' in test_case else {}),
-                            **({"customfield_10037": {"id": self._get_journey_id(test_case['journey'])}} if 'journey' in test_case else {})
-                        }
-                    }
-                    for test_case in test_cases
-                ]
-            }
-
-            # Create test cases
-            response = requests.post(
-                f"{self.base_url}/rest/api/3/issue/bulk",
-                headers=self.headers,
-                json=bulk_payload
-            )
-
-            if response.status_code != 201:
-                error_details = response.json() if response.text else "No error details available"
-                raise Exception(f"Failed to create test cases in bulk: {error_details}")
-
-            created_issues = response.json()['issues']
-            return [
-                {
-                    'key': issue['key'],
-                    'title': test_cases[i]['title'],
-                    'linked': False
-                }
-                for i, issue in enumerate(created_issues)
-            ]
-
-        except Exception as e:
-            self._print_status(f"Error in bulk creation: {str(e)}", "error")
-            return []
-
     def _bulk_create_links(self, test_cases: List[Dict], story_key: str) -> List[Dict]:
-        """Create links between test cases and story"""
-        linked_tests = []
-        for test in test_cases:
+        """Create links between test cases and story (concurrently over the pooled session, in input order)"""
+        def link_one(test):
             try:
                 if self.create_link(test['key'], story_key):
                     test['linked'] = True
-                linked_tests.append(test)
+                return test
             except Exception as e:
                 self._print_status(f"Failed to link {test['key']}: {str(e)}", "warning")
-                linked_tests.append({**test, 'linked': False})
+                return {**test, 'linked': False}
 
-        return linked_tests
+        return list(self.executor.map(link_one, test_cases))
 
     def get_link_types(self):
         """Get available issue link types with caching"""
         if self._cache['link_types'] is None:
             url = f"{self.api_client.base_url}/rest/api/3/issueLinkType"
-            response = requests.get(url, headers=self.headers)
+            response = self._send('GET', url)
             response.raise_for_status()
-            data = response.json()
+            data = json_utils.loads(response.content)
             self._cache['link_types'] = data.get('issueLinkTypes', [])
             logger.info("Available link types:")
             for link_type in self._cache['link_types']:
@@ -417,29 +539,21 @@ class JiraClient:
         """Get test cases linked to an issue"""
         try:
             url = f"{self.api_client.base_url}/rest/api/3/issue/{issue_key}"
-            response = requests.get(
+            response = self._send(
+                'GET',
                 url,
-                headers=self.headers,
-                params={
-                    'fields': 'issuelinks',
-                    'maxResults': 1  # Only check if any links exist
-                }
+                params={'fields': 'issuelinks'}
             )
             response.raise_for_status()
             
-            # Quick check if there are any links
-            issue_links = response.json().get('fields', {}).get('issuelinks', [])
-            if not issue_links:
-                return []  # Return empty list if no links found
-                
-            # If links exist, then get test cases
-            test_cases = []
-            for link in issue_links:
-                linked_issue = link.get('inwardIssue') or link.get('outwardIssue')
-                if linked_issue and linked_issue.get('key', '').startswith(issue_key.split('-')[0]):
-                    test_cases.append(linked_issue)
-            
-            return test_cases
+            # Linked issues from the same project, in one pass
+            issue_links = json_utils.loads(response.content).get('fields', {}).get('issuelinks', [])
+            project_prefix = issue_key.split('-', 1)[0]
+            return [
+                linked_issue for link in issue_links
+                if (linked_issue := link.get('inwardIssue') or link.get('outwardIssue'))
+                and linked_issue.get('key', '').startswith(project_prefix)
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get linked test cases for {issue_key}: {str(e)}")
@@ -453,9 +567,12 @@ class JiraClient:
             except Exception as e:
                 logger.warning(f"Failed to update assignee for {test_key}: {str(e)}")
 
-    @retry_on_failure(max_retries=3, delay=1)
-    def create_link(self, inward_key, outward_key, link_type="Relates"):
-        """Create a link between two issues with retry logic"""
+    @retry_on_failure(max_retries=3, delay=1, retry_if=_never_sent)
+    def create_link(self, inward_key, outward_key, link_type="Relates", verify_no_duplicate=False):
+        """
+        Create a link between two issues, retried only when the request never reached the server
+        Unknown keys surface as the link POST's own 404; set verify_no_duplicate to skip existing links (one extra GET)
+        """
         try:
             # Validate issue keys
             if not inward_key or not outward_key:
@@ -465,24 +582,14 @@ class JiraClient:
                 if not isinstance(key, str) or '-' not in key:
                     raise ValueError(f"Invalid issue key format: {key}. Expected format: PROJECT-NUMBER")
                 
-            # First verify both issues exist
-            logger.debug(f"Verifying existence of issues before linking: {inward_key} and {outward_key}")
-            inward_issue = self.get_issue(inward_key)
-            outward_issue = self.get_issue(outward_key)
-            
-            if not inward_issue:
-                raise ValueError(f"Inward issue {inward_key} not found")
-            if not outward_issue:
-                raise ValueError(f"Outward issue {outward_key} not found")
-            
             # Check if link already exists to avoid duplicates
-            existing_links = self.get_linked_test_cases(outward_key)
-            if inward_key in existing_links:
-                logger.info(f"Link between {inward_key} and {outward_key} already exists")
-                return True
+            if verify_no_duplicate:
+                existing_links = self.get_linked_test_cases(outward_key)
+                if any(issue.get('key') == inward_key for issue in existing_links):
+                    logger.info(f"Link between {inward_key} and {outward_key} already exists")
+                    return True
             
-            logger.debug(f"Creating link from {inward_key} ({inward_issue.get('fields', {}).get('issuetype', {}).get('name')}) "
-                       f"to {outward_key} ({outward_issue.get('fields', {}).get('issuetype', {}).get('name')})")
+            logger.debug("Creating link from {} to {}", inward_key, outward_key)
             
             url = f"{self.api_client.base_url}/rest/api/3/issueLink"
             payload = {
@@ -491,20 +598,23 @@ class JiraClient:
                 "outwardIssue": {"key": outward_key}
             }
             
-            logger.debug(f"Creating link with payload: {json.dumps(payload)}")
+            logger.opt(lazy=True).debug("Creating link with payload: {}", lambda: json_utils.dumps(payload))
             
-            response = requests.post(
+            response = self._send(
+                'POST',
                 url,
-                headers=self.headers,
-                json=payload
+                data=json_utils.dumps_bytes(payload)
             )
             
-            response_text = response.text if response.text else "No response body"
-            logger.debug(f"Link creation response status: {response.status_code}")
-            logger.debug(f"Link creation response: {response_text}")
+            logger.debug("Link creation response status: {}", response.status_code)
             
-            if response.status_code != 201 and response.status_code != 204:
-                raise ValueError(f"Failed to create link: {response_text}")
+            # Server errors and a 429 _send gave up on raise HTTPError
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()
+            
+            # The body is only decoded when it is needed for the error
+            if response.status_code not in (201, 204):
+                raise ValueError(f"Failed to create link: {response.text or 'No response body'}")
                 
             logger.info(f"Successfully linked {inward_key} to {outward_key} with type 'Relates'")
             return True
@@ -526,24 +636,24 @@ class JiraClient:
                 "outwardIssue": {"key": outward_issue}
             }
             
-            logger.debug(f"Creating issue link. URL: {url}")
-            logger.debug(f"Link payload: {json.dumps(payload)}")
+            logger.debug("Creating issue link. URL: {}", url)
+            logger.opt(lazy=True).debug("Link payload: {}", lambda: json_utils.dumps(payload))
             
-            response = requests.post(
+            response = self._send(
+                'POST',
                 url,
-                headers=self.headers,
-                json=payload
+                data=json_utils.dumps_bytes(payload)
             )
             
-            logger.debug(f"Link response status: {response.status_code}")
-            if response.status_code != 201 and response.status_code != 204:
-                logger.debug(f"Link response content: {response.text}")
+            logger.debug("Link response status: {}", response.status_code)
+            if response.status_code not in (201, 204):
+                logger.debug("Link response content: {}", response.text)
             
             response.raise_for_status()
             logger.info(f"Issue link created successfully between {inward_issue} and {outward_issue}")
             return True
         except requests.exceptions.HTTPError as error:
-            error_message = error.response.json() if error.response.text else str(error)
+            error_message = json_utils.loads(error.response.content) if error.response.content else str(error)
             logger.error(f"Error creating issue link: {error_message}")
             raise Exception(f"Failed to create issue link: {error_message}")
         except Exception as e:
@@ -559,12 +669,12 @@ class JiraClient:
             url = f"{self.api_client.base_url}/rest/api/3/issue/{issue_key}/assignee"
             payload = {"accountId": account_id}
             
-            logger.debug(f"Updating assignee for {issue_key} to {account_id}")
+            logger.debug("Updating assignee for {} to {}", issue_key, account_id)
             
-            response = requests.put(
+            response = self._send(
+                'PUT',
                 url,
-                headers=self.headers,
-                json=payload
+                data=json_utils.dumps_bytes(payload)
             )
             
             if response.status_code == 404:
@@ -581,24 +691,21 @@ class JiraClient:
             raise
     
     def update_issue_description(self, issue_key, description):
-        """Update the description of an issue"""
+        """Update the description of an issue (an ADF dict, or ADF already serialized to JSON bytes)"""
         try:
             if not issue_key or '-' not in issue_key:
                 raise ValueError(f"Invalid issue key format: {issue_key}")
                 
             url = f"{self.api_client.base_url}/rest/api/3/issue/{issue_key}"
-            payload = {
-                "fields": {
-                    "description": description
-                }
-            }
+            if not isinstance(description, bytes):
+                description = json_utils.dumps_bytes(description)
             
-            logger.debug(f"Updating description for {issue_key}")
+            logger.debug("Updating description for {}", issue_key)
             
-            response = requests.put(
+            response = self._send(
+                'PUT',
                 url,
-                headers=self.headers,
-                json=payload
+                data=b'{"fields":{"description":%s}}' % description
             )
             
             if response.status_code == 404:
@@ -643,17 +750,17 @@ class JiraClient:
             }
 
             # Create test case
-            response = requests.post(
+            response = self._send(
+                'POST',
                 f"{self.api_client.base_url}/rest/api/3/issue",
-                headers=self.headers,
-                json={'fields': fields}
+                data=json_utils.dumps_bytes({'fields': fields})
             )
             
             if response.status_code != 201:
                 logger.error(f"Failed to create test scenario: {response.text}")
                 raise Exception("Failed to create test scenario")
 
-            test_case = response.json()
+            test_case = json_utils.loads(response.content)
             logger.info(f"Created test scenario {test_case['key']}")
 
             # Link to story
@@ -674,7 +781,9 @@ class JiraClient:
         
         # Validate test exists and is correct type
         test_details = self.get_issue(test_key)
-        if test_details['type'] != 'Test':
+        if not test_details:
+            raise ValueError(f"Issue {test_key} not found")
+        if test_details.get('fields', {}).get('issuetype', {}).get('name') != 'Test Scenario':
             raise ValueError(f"Issue {test_key} is not a test scenario")
 
         # Prepare fields
@@ -704,42 +813,64 @@ class JiraClient:
 
     def _get_journey_id(self, journey_name: str) -> str:
         """Get journey ID from journey name"""
-        journey_mapping = {
-            'Account': '10054',
-            'Buyer Management': '10059',
-            'Seller Management': '10060',
-            'RFQ': '10441',
-            'Backoffice': '10068',
-            'Enterprise': '10440',
-            'Purchase': '10439',
-            'Discovery': '10063',
-            'Catalogue': '10069'
-        }
-        
         # Default to Account if journey not found
-        return journey_mapping.get(journey_name, '10054')  # Default to Account journey
+        return self._JOURNEY_MAPPING.get(journey_name, '10054')  # Default to Account journey
 
     @retry_on_failure(max_retries=3, delay=1)
     def delete_issue(self, issue_key: str) -> bool:
-        """Delete an issue from Jira"""
+        """Delete an issue from Jira (transient errors propagate so the retry decorator sees them)"""
         try:
-            response = self.api_client.delete(f'rest/api/3/issue/{issue_key}')
+            self.api_client.delete(f'rest/api/3/issue/{issue_key}')
             return True
         except Exception as e:
+            if _is_transient(e):
+                raise
             logger.error(f"Failed to delete issue {issue_key}: {str(e)}")
             return False
 
+    def search_issues(self, jql: str, fields: Optional[List[str]] = None, batch_size: int = 500) -> Dict:
+        """
+        Run a JQL search, following startAt pages; the first page's payload is returned with every page's issues
+        Large pages cut round-trips; Jira may cap maxResults lower (e.g. 100), in which case its page size is used
+        """
+        url = f"{self.api_client.base_url}/rest/api/3/search"
+        params = {'jql': jql, 'startAt': 0, 'maxResults': batch_size}
+        if fields:
+            params['fields'] = ','.join(fields)
+
+        result = None
+        issues = []
+        while True:
+            response = self._send('GET', url, params=params)
+            response.raise_for_status()
+            page = json_utils.loads(response.content)
+            batch = page.get('issues', [])
+            if result is None:
+                result = page
+                # A short first page with more to come means the server capped the page size
+                if len(batch) < batch_size and len(batch) < page.get('total', 0):
+                    logger.warning("Jira capped search page size at {} (requested {})", len(batch), batch_size)
+                    params['maxResults'] = len(batch)
+
+            issues.extend(batch)
+            params['startAt'] += len(batch)
+            if not batch or params['startAt'] >= page.get('total', 0):
+                break
+
+        result['issues'] = issues
+        return result
+
     def get_existing_test_cases(self, story_key: str, quiet: bool = False) -> List[Dict]:
         """Get existing test cases linked to a story"""
         try:
             # Search for test cases linked to this story
             jql = f'project = "{story_key.split("-")[0]}" AND "Linked Stories" ~ "{story_key}" AND issuetype = "Test Scenario"'
             
-            search_results = self.search_issues(jql)
+            search_results = self.search_issues(jql, batch_size=500)
             test_cases = search_results.get('issues', [])
             
             if not quiet and test_cases:
-                logger.debug(f"Found {len(test_cases)} existing test cases for {story_key}")
+                logger.debug("Found {} existing test cases for {}", len(test_cases), story_key)
                 
             return test_cases
             
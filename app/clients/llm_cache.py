@@ -0,0 +1,120 @@
+"""
+LLM Response Cache - exact-match reuse of deterministic completions
+In-memory LRU with TTL, optionally backed by a persistent key/value store
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from loguru import logger
+
+# Only whitespace runs are collapsed: case and punctuation ("age < 18" vs "age > 18") change the request
+_RE_WHITESPACE = re.compile(r'\s+')
+
+
+def _normalize_text(text: str) -> str:
+    """Canonical form of prompt text used for cache keys"""
+    return _RE_WHITESPACE.sub(' ', text).strip()
+
+
+def _normalize_messages(messages: Any) -> Any:
+    """Normalize a raw prompt string or a chat message list"""
+    if isinstance(messages, str):
+        return _normalize_text(messages)
+    if isinstance(messages, list):
+        return [
+            {**message, 'content': _normalize_text(message['content'])}
+            if isinstance(message, dict) and isinstance(message.get('content'), str) else message
+            for message in messages
+        ]
+    return messages
+
+
+class LLMCache:
+    """
+    Exact-match cache for LLM responses keyed on the full request (model, messages, sampling)
+    Only low-temperature requests are cacheable: sampled output is not meant to be replayed
+    """
+
+    MAX_CACHEABLE_TEMPERATURE = 0.3
+
+    def __init__(self, backend: Any = None, ttl: int = 3600, maxsize: int = 1024, enabled: bool = True):
+        """
+        backend: optional persistent store exposing get(key) -> Optional[str] and set(key, value)
+        """
+        self.enabled = enabled
+        self.backend = backend
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (expires_at, content)
+        self._lock = threading.Lock()
+
+    def cache_key(self, model: str, messages: Any, temperature: float, max_tokens: int) -> Optional[str]:
+        """
+        SHA256 of the request, or None when the request is not cacheable
+        Prompt text is compared exactly apart from whitespace runs, which are collapsed
+        """
+        if not self.enabled or temperature > self.MAX_CACHEABLE_TEMPERATURE:
+            return None
+        payload = {
+            'v': 2,  # Entries written under the old case/punctuation-folding key are never read back
+            'model': model,
+            'messages': _normalize_messages(messages),
+            'temperature': temperature,
+            'max_tokens': max_tokens
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Return cached content: memory first, then the backend (promoted to memory on hit)"""
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, content = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return content
+                del self._entries[key]
+
+        if self.backend is None:
+            return None
+        try:
+            content = self.backend.get(f"llm:{key}")
+        except Exception as e:
+            logger.debug(f"LLM cache backend read failed: {e}")
+            return None
+        if content is not None:
+            self._remember(key, content)
+        return content
+
+    def set(self, key: Optional[str], content: str) -> None:
+        """Store content in memory and write it through to the backend"""
+        if key is None or not content:
+            return
+
+        self._remember(key, content)
+        if self.backend is not None:
+            try:
+                self.backend.set(f"llm:{key}", content)
+            except Exception as e:
+                logger.warning(f"⚠️ LLM cache backend write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all in-memory entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, content: str) -> None:
+        """Insert into the in-memory LRU, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, content)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
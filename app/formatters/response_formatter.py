@@ -1,14 +1,110 @@
 from loguru import logger
 import json
-from typing import Dict, Any, Optional, List
+import re
+import threading
+from copy import deepcopy
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional, List, Tuple
 from functools import lru_cache
-from datetime import datetime, timedelta
+from datetime import datetime
+
+
+# ADF node handlers: each emits its own text into out and pushes its children (and any closing (text,)) onto the
+# stack in reverse, so popping the stack walks the document in order without recursion
+def _adf_text(item, stack, out):
+    out.append(item.get('text', ''))
+
+def _adf_heading(item, stack, out):
+    out.append('\n' + '#' * item.get('attrs', {}).get('level', 1) + ' ')
+    stack.append(('\n',))
+    stack.extend(reversed(item.get('content', [])))
+
+def _adf_bullet_list(item, stack, out):
+    for list_item in reversed(item.get('content', [])):
+        stack.extend(reversed(list_item.get('content', [])))
+        stack.append(('\n- ',))
+
+def _adf_ordered_list(item, stack, out):
+    list_items = item.get('content', [])
+    for number in range(len(list_items), 0, -1):
+        stack.extend(reversed(list_items[number - 1].get('content', [])))
+        stack.append((f'\n{number}. ',))
+
+def _adf_paragraph(item, stack, out):
+    stack.append(('\n',))
+    stack.extend(reversed(item.get('content', [])))
+
+_ADF_HANDLERS = {
+    'text': _adf_text,
+    'heading': _adf_heading,
+    'bulletList': _adf_bullet_list,
+    'orderedList': _adf_ordered_list,
+    'paragraph': _adf_paragraph,
+}
+
+
+def extract_adf_text(content_list: List[Dict[str, Any]], out: List[str]) -> List[str]:
+    """Append the plain text of ADF content nodes to out (iterative; unknown node types are skipped)"""
+    stack = deque(reversed(content_list))
+    while stack:
+        item = stack.pop()
+        if type(item) is tuple:  # (text,) queued by a handler to follow a node's children
+            out.append(item[0])
+            continue
+        handler = _ADF_HANDLERS.get(item.get('type'))
+        if handler is not None:
+            handler(item, stack, out)
+    return out
+
+
+# key=value pairs of a legacy sprint string ("...Sprint@1a2b[id=1,state=ACTIVE,name=Sprint 4,startDate=...]")
+_SPRINT_FIELD_RE = re.compile(r'(\w+)=([^,\]]*)')
+
+
+@lru_cache(maxsize=4096)
+def _fmt_jira_ts(timestamp: str) -> str:
+    """Jira timestamp ('2024-01-02T03:04:05.000+0000') as 'YYYY-MM-DD HH:MM:SS' (cached: pages repeat timestamps)"""
+    try:
+        parsed = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:  # Python < 3.11 rejects offsets without a colon
+        parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f%z")
+    return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
+
+# ADF node templates for format_description
+def _text_node(text: str) -> Dict[str, Any]:
+    return {"type": "text", "text": text}
+
+def _paragraph_node(text: str) -> Dict[str, Any]:
+    return {"type": "paragraph", "content": [_text_node(text)]}
+
+def _description_block(para: str) -> Dict[str, Any]:
+    """ADF block for one description paragraph: '#' heading, '- ' bullet list or plain paragraph"""
+    if para.startswith('#'):
+        level = len(para.split()[0])  # Count # symbols
+        return {
+            "type": "heading",
+            "attrs": {"level": min(level, 6)},
+            "content": [_text_node(para.lstrip('#').strip())]
+        }
+    if para.strip().startswith('- '):
+        return {
+            "type": "bulletList",
+            "content": [
+                {"type": "listItem", "content": [_paragraph_node(line.strip('- ').strip())]}
+                for line in para.split('\n') if line.strip().startswith('- ')
+            ]
+        }
+    return _paragraph_node(para)
+
 
 class ResponseFormatter:
+    # Formatted issues kept per (key, updated) pair; an edit bumps 'updated' and so misses the cache
+    ISSUE_CACHE_SIZE = 100
+
     def __init__(self):
-        self.field_cache = {}
-        self.cache_expiry = {}
-        self.cache_duration = timedelta(minutes=30)
+        self._issue_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._issue_cache_lock = threading.Lock()
 
     @staticmethod
     def format_description(text: str) -> Dict[str, Any]:
@@ -16,53 +112,8 @@ class ResponseFormatter:
         if isinstance(text, dict):
             return text  # Already in ADF format
             
-        # Split text into paragraphs
-        paragraphs = text.split('\n\n')
-        content = []
-        
-        for para in paragraphs:
-            if not para.strip():
-                continue
-                
-            # Check for headings
-            if para.startswith('#'):
-                level = len(para.split()[0])  # Count # symbols
-                content.append({
-                    "type": "heading",
-                    "attrs": {"level": min(level, 6)},
-                    "content": [{
-                        "type": "text",
-                        "text": para.lstrip('#').strip()
-                    }]
-                })
-            # Check for bullet points
-            elif para.strip().startswith('- '):
-                items = []
-                for line in para.split('\n'):
-                    if line.strip().startswith('- '):
-                        items.append({
-                            "type": "listItem",
-                            "content": [{
-                                "type": "paragraph",
-                                "content": [{
-                                    "type": "text",
-                                    "text": line.strip('- ').strip()
-                                }]
-                            }]
-                        })
-                content.append({
-                    "type": "bulletList",
-                    "content": items
-                })
-            # Regular paragraph
-            else:
-                content.append({
-                    "type": "paragraph",
-                    "content": [{
-                        "type": "text",
-                        "text": para
-                    }]
-                })
+        # One ADF block per non-blank paragraph
+        content = [_description_block(para) for para in text.split('\n\n') if para.strip()]
 
         return {
             "type": "doc",
@@ -78,25 +129,7 @@ class ResponseFormatter:
 
         text_content = []
         try:
-            def process_content(content_list):
-                text = []
-                for item in content_list:
-                    if item.get('type') == 'text':
-                        text.append(item.get('text', ''))
-                    elif item.get('type') == 'heading':
-                        text.append('\n' + '#' * item.get('attrs', {}).get('level', 1) + ' ')
-                        text.extend(process_content(item.get('content', [])))
-                        text.append('\n')
-                    elif item.get('type') == 'bulletList':
-                        for list_item in item.get('content', []):
-                            text.append('\n- ')
-                            text.extend(process_content(list_item.get('content', [])))
-                    elif item.get('type') == 'paragraph':
-                        text.extend(process_content(item.get('content', [])))
-                        text.append('\n')
-                return text
-
-            text_content = process_content(description.get('content', []))
+            extract_adf_text(description.get('content', []), text_content)
             
         except Exception as e:
             logger.warning(f"Error extracting description text: {str(e)}")
@@ -104,18 +137,39 @@ class ResponseFormatter:
 
         return ''.join(text_content).strip()
 
-    @lru_cache(maxsize=100)
     def format_issue_data(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Format issue data for display/output with caching"""
+        """
+        Format issue data for display/output with caching
+        The cache keeps its own copy and every call gets a fresh one, so callers may mutate the result
+        """
         fields = issue_data.get('fields', {})
-        
+        cache_key = (issue_data.get('key'), fields.get('updated'))
+        if None in cache_key:
+            # Without both parts distinct or edited issues would share an entry; format uncached
+            return self._format_issue_fields(issue_data, fields)
+        with self._issue_cache_lock:
+            cached = self._issue_cache.get(cache_key)
+            if cached is not None:
+                self._issue_cache.move_to_end(cache_key)
+                return deepcopy(cached)
+
+        formatted = self._format_issue_fields(issue_data, fields)
+        with self._issue_cache_lock:
+            # Also detaches nested values (e.g. labels) shared with the caller's issue_data
+            self._issue_cache[cache_key] = deepcopy(formatted)
+            if len(self._issue_cache) > self.ISSUE_CACHE_SIZE:
+                self._issue_cache.popitem(last=False)
+        return formatted
+
+    def _format_issue_fields(self, issue_data: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Uncached formatting behind format_issue_data"""
         # Format dates
         created = fields.get('created')
         updated = fields.get('updated')
         if created:
-            created = datetime.strptime(created, "%Y-%m-%dT%H:%M:%S.%f%z").strftime("%Y-%m-%d %H:%M:%S")
+            created = _fmt_jira_ts(created)
         if updated:
-            updated = datetime.strptime(updated, "%Y-%m-%dT%H:%M:%S.%f%z").strftime("%Y-%m-%d %H:%M:%S")
+            updated = _fmt_jira_ts(updated)
             
         return {
             "issue_key": issue_data.get('key'),
@@ -141,29 +195,21 @@ class ResponseFormatter:
 
     def _extract_sprint_info(self, sprint_field: List[Any]) -> Optional[Dict[str, Any]]:
         """Extract sprint information from the sprint field"""
-        if not sprint_field:
+        if not sprint_field or not isinstance(sprint_field, list):
             return None
             
-        try:
-            # Get the most recent sprint
-            latest_sprint = sprint_field[-1]
-            if isinstance(latest_sprint, str):
-                # Parse the sprint string format
-                sprint_data = {}
-                for item in latest_sprint.strip('[]').split(','):
-                    if '=' in item:
-                        key, value = item.split('=', 1)
-                        sprint_data[key.strip()] = value.strip()
-                return {
-                    'name': sprint_data.get('name'),
-                    'state': sprint_data.get('state'),
-                    'start_date': sprint_data.get('startDate'),
-                    'end_date': sprint_data.get('endDate')
-                }
-            return latest_sprint
-        except Exception as e:
-            logger.warning(f"Error extracting sprint info: {str(e)}")
-            return None
+        # Get the most recent sprint
+        latest_sprint = sprint_field[-1]
+        if isinstance(latest_sprint, str):
+            # Parse the sprint string format
+            sprint_data = dict(_SPRINT_FIELD_RE.findall(latest_sprint))
+            return {
+                'name': sprint_data.get('name'),
+                'state': sprint_data.get('state'),
+                'start_date': sprint_data.get('startDate'),
+                'end_date': sprint_data.get('endDate')
+            }
+        return latest_sprint
 
     def format_test_scenario_fields(self, project_key: str, test_data: Dict[str, Any], 
                                   test_type_id: str, journey_info: Dict[str, Any], 
@@ -173,13 +219,8 @@ class ResponseFormatter:
         if not all([project_key, test_data, test_type_id, journey_info, user_info]):
             raise ValueError("Missing required fields for test scenario creation")
             
-        # Get cached field values or format new ones
-        cache_key = f"{project_key}_{test_type_id}"
-        if cache_key in self.field_cache:
-            if datetime.now() - self.cache_expiry[cache_key] < self.cache_duration:
-                return self.field_cache[cache_key]
-                
-        formatted_fields = {
+        # Not cached: the fields depend on every input, and building them is cheaper than keying on all of them
+        return {
             'project': {'key': project_key},
             'issuetype': {'id': test_type_id},
             'summary': test_data['title'],
@@ -191,10 +232,4 @@ class ResponseFormatter:
             'priority': {'name': test_data.get('priority', 'P3 - Medium')},  # Priority
             'labels': test_data.get('labels', ['automated-test']),
             'components': [{'name': comp} for comp in test_data.get('components', [])],
-        }
-        
-        # Cache the formatted fields
-        self.field_cache[cache_key] = formatted_fields
-        self.cache_expiry[cache_key] = datetime.now()
-        
-        return formatted_fields 
\ No newline at end of file
+        } 
\ No newline at end of file
@@ -6,36 +6,72 @@ operations in the Jira test case generation system.
 """
 
 import re
-from typing import List, Dict, Any
+import textwrap
+from collections import Counter
+from typing import ClassVar, List, Dict, Any, FrozenSet, Pattern
 from functools import lru_cache
 from loguru import logger
 
+from app.formatters.response_formatter import extract_adf_text
+from app.utils import json_utils
+
+# Words too common to say anything about a scenario's meaning
+_COMMON_WORDS: FrozenSet[str] = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'between', 'among', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'that', 'this', 'these', 'those'
+})
+
+# Serialized single-paragraph ADF document; %s takes the JSON-encoded paragraph text
+_ADF_PARAGRAPH_DOC = b'{"version":1,"type":"doc","content":[{"type":"paragraph","content":[{"type":"text","text":%s}]}]}'
+
+# Verbs a test title may already start with; only that many leading characters need lowercasing
+_TITLE_VERBS = ('verify', 'test', 'check', 'validate')
+_TITLE_VERB_PREFIX_LEN = max(map(len, _TITLE_VERBS))
+
+
+@lru_cache(maxsize=8)
+def _line_wrapper(width: int) -> textwrap.TextWrapper:
+    """Word wrapper for one line width; words are never split, even long ones or at hyphens"""
+    return textwrap.TextWrapper(width=width, break_long_words=False, break_on_hyphens=False)
+
 
 class TextFormatter:
     """Centralized text formatter for test scenarios and descriptions"""
     
+    # Compiled once at import and shared by every instance (patterns are stateless)
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        'whitespace': re.compile(r'\s+'),
+        'extra_spaces': re.compile(r'\s{2,}'),
+        'newline_normalization': re.compile(r'\n+'),
+        'step_numbering': re.compile(r'^\d+\.\s*'),
+        'bullet_points': re.compile(r'^[-*•]\s*'),
+        # Leading scenario verb, then a leading filler word (to/that/the...), stripped in a single match
+        'leading_filler': re.compile(
+            r'^(?:(?:verify|validate|check|test)\s+)?(?:(?:to|that|if|when|the|a|an)\s+)?', re.IGNORECASE
+        ),
+        # Verbose phrasing dropped from descriptions in one pass ("Test " goes first, so the longer
+        # "Test functionality: "/"Test system behavior when " forms never survive to be rewritten)
+        'impact_noise': re.compile('|'.join(map(re.escape, (
+            "Verify that the system correctly implements the requirement: ",
+            "functionality: ",
+            "Test ",
+        ))))
+    }
+
+    # Pre-defined step formatting templates
+    _STEP_TEMPLATES: ClassVar[Dict[str, str]] = {
+        'numbered': "{}. {}",
+        'bulleted': "• {}",
+        'plain': "{}"
+    }
+
     def __init__(self):
-        """Initialize text formatter with compiled regex patterns for better performance"""
+        """Initialize text formatter (regex patterns and step templates are shared class attributes)"""
         # Initialize logger
         self.logger = logger
-        
-        # Pre-compile regex patterns for better performance
-        self._patterns = {
-            'whitespace': re.compile(r'\s+'),
-            'scenario_prefix': re.compile(r'^(verify|validate|check|test)\s+', re.IGNORECASE),
-            'extra_spaces': re.compile(r'\s{2,}'),
-            'newline_normalization': re.compile(r'\n+'),
-            'step_numbering': re.compile(r'^\d+\.\s*'),
-            'bullet_points': re.compile(r'^[-*•]\s*'),
-            'common_prefixes': re.compile(r'^(to|that|if|when|the|a|an)\s+', re.IGNORECASE)
-        }
-        
-        # Pre-defined step formatting templates
-        self._step_templates = {
-            'numbered': "{}. {}",
-            'bulleted': "• {}",
-            'plain': "{}"
-        }
 
     def format_steps(self, steps: List[str], style: str = 'numbered') -> str:
         """Format steps with proper line breaks and numbering/bullets"""
@@ -43,14 +79,14 @@ class TextFormatter:
             return ""
         
         formatted_steps = []
-        template = self._step_templates.get(style, self._step_templates['numbered'])
+        template = self._STEP_TEMPLATES.get(style, self._STEP_TEMPLATES['numbered'])
         
         for i, step in enumerate(steps, 1):
             if not step or not step.strip():
                 continue
                 
             # Clean the step text
-            clean_step = self._patterns['whitespace'].sub(' ', step.strip())
+            clean_step = self._PATTERNS['whitespace'].sub(' ', step.strip())
             
             # Apply formatting based on style
             if style == 'numbered':
@@ -79,11 +115,7 @@ class TextFormatter:
     def _create_impactful_description(self, description: str, scenario_type: str) -> str:
         """Create a concise, impactful description with 'Verify that' prefix"""
         # Remove redundant prefixes and verbose language
-        clean_desc = description.replace("Test ", "").replace("Verify that the system correctly implements the requirement: ", "")
-        clean_desc = clean_desc.replace("Test functionality: ", "").replace("functionality: ", "")
-        clean_desc = clean_desc.replace("Test system behavior when ", "System behavior when ")
-        clean_desc = clean_desc.replace("Test automatic toggling behavior of ", "Auto-toggle behavior of ")
-        clean_desc = clean_desc.replace("Test ", "")
+        clean_desc = self._PATTERNS['impact_noise'].sub('', description)
         
         # Ensure first letter is capitalized
         if clean_desc:
@@ -102,13 +134,10 @@ class TextFormatter:
             return ""
         
         # Normalize whitespace
-        text = self._patterns['whitespace'].sub(' ', text.strip())
+        text = self._PATTERNS['whitespace'].sub(' ', text.strip())
         
-        # Remove common scenario prefixes
-        text = self._patterns['scenario_prefix'].sub('', text)
-        
-        # Remove common language prefixes
-        text = self._patterns['common_prefixes'].sub('', text)
+        # Remove the scenario verb and language prefixes
+        text = self._PATTERNS['leading_filler'].sub('', text, count=1)
         
         # Final cleanup
         return text.strip()
@@ -124,7 +153,7 @@ class TextFormatter:
             ADF formatted dictionary with clean description only
         """
         # Use only the description part, ignore any steps sections
-        description = text.split("\n\nSteps:\n")[0].strip()
+        description = self._description_only(text)
 
         content = []
 
@@ -140,6 +169,15 @@ class TextFormatter:
         })
 
         return {"version": 1, "type": "doc", "content": content}
+
+    def convert_to_adf_bytes(self, text: str) -> bytes:
+        """convert_to_adf serialized straight to JSON bytes (for request bodies; no intermediate dicts)"""
+        return _ADF_PARAGRAPH_DOC % json_utils.dumps_bytes(self._description_only(text))
+
+    @staticmethod
+    def _description_only(text: str) -> str:
+        """Description part of a scenario text, without any steps section"""
+        return text.split("\n\nSteps:\n")[0].strip()
     
     def format_with_bullets(self, description: str) -> str:
         """
@@ -151,17 +189,8 @@ class TextFormatter:
         Returns:
             Formatted text with bullet points
         """
-        # Split description into lines
-        lines = description.strip().split('\n')
-        formatted_text = ""
-        
-        for line in lines:
-            line = line.strip()
-            if line:
-                # Format each line as a bullet point with bold text
-                formatted_text += f"• **{line}**\n"
-        
-        return formatted_text
+        # Each non-blank line becomes a bold bullet point
+        return ''.join(f"• **{line}**\n" for line in map(str.strip, description.strip().split('\n')) if line)
     
     def extract_plain_text_from_adf(self, adf_content: Dict[str, Any]) -> str:
         """
@@ -178,29 +207,7 @@ class TextFormatter:
 
         text_content = []
         try:
-            def process_content(content_list):
-                text = []
-                for item in content_list:
-                    if item.get('type') == 'text':
-                        text.append(item.get('text', ''))
-                    elif item.get('type') == 'heading':
-                        text.append('\n' + '#' * item.get('attrs', {}).get('level', 1) + ' ')
-                        text.extend(process_content(item.get('content', [])))
-                        text.append('\n')
-                    elif item.get('type') == 'bulletList':
-                        for list_item in item.get('content', []):
-                            text.append('\n- ')
-                            text.extend(process_content(list_item.get('content', [])))
-                    elif item.get('type') == 'orderedList':
-                        for i, list_item in enumerate(item.get('content', []), 1):
-                            text.append(f'\n{i}. ')
-                            text.extend(process_content(list_item.get('content', [])))
-                    elif item.get('type') == 'paragraph':
-                        text.extend(process_content(item.get('content', [])))
-                        text.append('\n')
-                return text
-
-            text_content = process_content(adf_content.get('content', []))
+            extract_adf_text(adf_content.get('content', []), text_content)
             
         except Exception as e:
             self.logger.warning(f"Error extracting description text: {str(e)}")
@@ -214,36 +221,25 @@ class TextFormatter:
             return ""
         
         # Convert to lowercase and normalize whitespace
-        normalized = self._patterns['whitespace'].sub(' ', text.lower().strip())
+        normalized = self._PATTERNS['whitespace'].sub(' ', text.lower().strip())
         
         # Remove common prefixes and suffixes
-        normalized = self._patterns['scenario_prefix'].sub('', normalized)
-        normalized = self._patterns['common_prefixes'].sub('', normalized)
+        normalized = self._PATTERNS['leading_filler'].sub('', normalized, count=1)
         
         return normalized
 
     @lru_cache(maxsize=200)
-    def extract_key_phrases(self, text: str) -> set:
-        """Extract key phrases from text for semantic comparison with caching"""
+    def extract_key_phrases(self, text: str) -> FrozenSet[str]:
+        """Extract key phrases from text for semantic comparison with caching (frozen: the cached value is shared)"""
         if not text:
-            return set()
+            return frozenset()
         
         # Normalize text
         normalized = self.normalize_text_for_comparison(text)
         
         # Split into words and filter out common words
-        common_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
-            'above', 'below', 'between', 'among', 'is', 'are', 'was', 'were', 'be', 'been',
-            'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'must', 'can', 'that', 'this', 'these', 'those'
-        }
-        
         words = normalized.split()
-        key_phrases = {word for word in words if len(word) > 2 and word not in common_words}
-        
-        return key_phrases
+        return frozenset(word for word in words if len(word) > 2 and word not in _COMMON_WORDS)
 
     def calculate_text_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts using key phrase overlap"""
@@ -271,7 +267,7 @@ class TextFormatter:
         clean_action = self.clean_scenario_text(action)
         
         # Ensure proper verb prefix
-        if not any(clean_action.lower().startswith(verb) for verb in ['verify', 'test', 'check', 'validate']):
+        if not clean_action[:_TITLE_VERB_PREFIX_LEN].lower().startswith(_TITLE_VERBS):
             clean_action = f"Verify {clean_action}"
         
         # Add context if provided
@@ -292,36 +288,12 @@ class TextFormatter:
         if not text:
             return ""
         
-        # Split by existing newlines first
-        paragraphs = text.split('\n')
-        formatted_paragraphs = []
-        
-        for paragraph in paragraphs:
-            if not paragraph.strip():
-                formatted_paragraphs.append("")
-                continue
-            
-            # Wrap long lines
-            words = paragraph.split()
-            current_line = []
-            current_length = 0
-            
-            for word in words:
-                word_length = len(word)
-                
-                if current_length + word_length + 1 <= max_line_length:
-                    current_line.append(word)
-                    current_length += word_length + 1
-                else:
-                    if current_line:
-                        formatted_paragraphs.append(' '.join(current_line))
-                    current_line = [word]
-                    current_length = word_length
-            
-            if current_line:
-                formatted_paragraphs.append(' '.join(current_line))
-        
-        return '\n'.join(formatted_paragraphs)
+        # Wrap each existing line on its own; runs of whitespace collapse to single spaces
+        wrap = _line_wrapper(max_line_length).wrap
+        return '\n'.join(
+            '\n'.join(wrap(' '.join(paragraph.split()))) if paragraph.strip() else ''
+            for paragraph in text.split('\n')
+        )
 
     def clean_step_text(self, step: str) -> str:
         """Clean individual step text for better formatting"""
@@ -329,11 +301,11 @@ class TextFormatter:
             return ""
         
         # Remove existing numbering/bullets
-        clean = self._patterns['step_numbering'].sub('', step)
-        clean = self._patterns['bullet_points'].sub('', clean)
+        clean = self._PATTERNS['step_numbering'].sub('', step)
+        clean = self._PATTERNS['bullet_points'].sub('', clean)
         
         # Normalize whitespace
-        clean = self._patterns['whitespace'].sub(' ', clean.strip())
+        clean = self._PATTERNS['whitespace'].sub(' ', clean.strip())
         
         # Ensure sentence case
         if clean and not clean[0].isupper():
@@ -369,11 +341,7 @@ class TextFormatter:
             suggestions.append('Add more descriptive words')
         
         # Check for repeated words
-        word_counts = {}
-        for word in words:
-            word_lower = word.lower()
-            word_counts[word_lower] = word_counts.get(word_lower, 0) + 1
-        
+        word_counts = Counter(map(str.lower, words))
         repeated_words = [word for word, count in word_counts.items() if count > 3 and len(word) > 3]
         if repeated_words:
             issues.append(f'Repeated words found: {", ".join(repeated_words[:3])}')
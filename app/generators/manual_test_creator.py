@@ -5,6 +5,7 @@ import time
 from config.config import Config
 from app.clients.jira_client import JiraClient
 from app.managers.scenario_manager import TestScenarioManager
+from app.utils.admission_control import AdmissionController
 from loguru import logger
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
@@ -143,27 +144,49 @@ class ManualTestCreator:
             if not user_info:
                 raise Exception("Failed to get current user info")
                 
-            # Create test cases
-            success = True
-            for scenario in scenarios:
-                try:
-                    # Add story key and assignee to scenario
-                    scenario['parent_key'] = story_key
-                    scenario['assignee_id'] = user_info['accountId']
-                    
-                    # Create test case using scenario manager
-                    issue_key = self.test_scenario_manager.create_test_scenario(scenario)
-                    if not issue_key:
-                        logger.error(f"Failed to create test case: {scenario['title']}")
-                        success = False
-                    else:
-                        logger.info(f"Created test case: {scenario['title']} with key {issue_key}")
-                        
-                except Exception as e:
-                    logger.error(f"Error creating test case: {str(e)}")
-                    success = False
-                    
-            return success
+            # Warm the issue type cache once so the workers don't all fetch it
+            self.jira_client.get_issue_types(story_key.split('-')[0])
+
+            # Create test cases concurrently: each one is an independent Jira round-trip, admitted under an
+            # adaptive limit that backs off when Jira throttles
+            admission = AdmissionController(
+                min_limit=self.config.get('jira_min_workers', 1),
+                # Capped at the client's request gate: a higher limit would only queue behind it
+                max_limit=min(self.config.get('jira_max_workers', 5), self.jira_client.max_concurrent_requests),
+                target_latency=self.config.get('jira_target_latency', 2.0)
+            )
+
+            def create_admitted(scenario):
+                with admission.admit():
+                    return self._create_single_scenario(scenario, story_key, user_info['accountId'])
+
+            created_scenarios = []
+            failed_scenarios = []
+            # The client resends throttled requests itself; the listener lets the limit react to the first 429 and to
+            # a shrinking X-RateLimit-Remaining quota
+            self.jira_client.response_listener = admission.observe_response
+            try:
+                with ThreadPoolExecutor(max_workers=admission.max_limit) as executor:
+                    futures = {executor.submit(create_admitted, scenario): scenario for scenario in scenarios}
+                    for future in as_completed(futures):
+                        scenario = futures[future]
+                        try:
+                            created = future.result()
+                        except Exception as e:
+                            logger.error(f"Error creating test case: {str(e)}")
+                            failed_scenarios.append({'title': scenario['title'], 'error': str(e)})
+                            continue
+                        if not created:
+                            logger.error(f"Failed to create test case: {scenario['title']}")
+                            failed_scenarios.append({'title': scenario['title'], 'error': 'No issue key returned'})
+                        else:
+                            logger.info(f"Created test case: {created['title']} with key {created['key']}")
+                            created_scenarios.append(created)
+            finally:
+                self.jira_client.response_listener = None
+
+            logger.info(f"Created {len(created_scenarios)}/{len(scenarios)} test cases for {story_key}")
+            return not failed_scenarios
             
         except Exception as e:
             logger.error(f"Error in create_manual_test_scenarios: {str(e)}")
@@ -386,6 +386,11 @@ class StoryTestGenerator:
                 print("⚠️  Some operations failed. Check logs for details.")
             print("=" * 40 + "\n")
 
+    def close(self):
+        """Release the AI clients' worker threads and caches and the Jira connection pool"""
+        self.ai_service_manager.close()
+        self.jira_client.close()
+
     def log_progress(self, message: str, level: str = "info"):
         """Log progress with minimal output"""
         if self.verbose:
@@ -697,6 +702,8 @@ def main():
     except Exception as e:
         print(f"❌ Error processing story: {str(e)}")
         sys.exit(1)
+    finally:
+        generator.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
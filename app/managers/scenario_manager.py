@@ -10,7 +10,7 @@ from loguru import logger
 from app.clients.jira_client import JiraClient
 from app.formatters.text_formatter import text_formatter
 from datetime import datetime, timedelta
-from app.utils.utils import get_custom_field_id, convert_to_adf
+from app.utils.utils import get_custom_field_id, convert_to_adf_bytes
 import time
 import re
 
@@ -73,9 +73,8 @@ class TestScenarioManager:
             # Get project key from parent story
             project_key = parent_key.split('-')[0]
             
-            # Get issue type ID for "Test Scenario"
-            issue_types = self.jira_client.get_issue_types(project_key)
-            test_type = next((t for t in issue_types if t['name'] == 'Test Scenario'), None)
+            # Get issue type ID for "Test Scenario" (resolved once per project by the client's cached name index)
+            test_type = self.jira_client.get_issue_type(project_key, 'Test Scenario')
             if not test_type:
                 raise ValueError("Test Scenario issue type not found")
 
@@ -221,7 +220,7 @@ class TestScenarioManager:
         """Update the description of a test scenario"""
         try:
             logger.debug(f"Updating description for issue {issue_key}")
-            description_adf = convert_to_adf(description)
+            description_adf = convert_to_adf_bytes(description)
             self.jira_client.update_issue_description(issue_key, description_adf)
             logger.info(f"Updated description for issue {issue_key}")
             return True
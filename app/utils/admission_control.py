@@ -0,0 +1,144 @@
+"""
+Adaptive concurrency limit for fan-out Jira calls.
+AIMD (additive increase, multiplicative decrease): the limit grows by one after each window of fast successes
+and halves on 429/5xx responses, and every caller waits out any Retry-After the server sends.
+Responses that report their remaining quota (X-RateLimit-Remaining) shrink the limit to fit it, and an
+exhausted quota pauses admissions until X-RateLimit-Reset, before Jira starts answering 429.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Optional
+
+from loguru import logger
+
+
+def _retry_after(response) -> float:
+    """Seconds from a response's Retry-After header (0 when absent or in HTTP-date form)"""
+    try:
+        return max(0.0, float(response.headers.get('Retry-After', 0)))
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+
+
+def _rate_limit_remaining(response) -> Optional[int]:
+    """Requests left in the current quota window from X-RateLimit-Remaining (None when absent or malformed)"""
+    try:
+        return int(response.headers['X-RateLimit-Remaining'])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _rate_limit_reset(response) -> float:
+    """Seconds until the quota window resets, from the ISO 8601 X-RateLimit-Reset header (0 when unknown)"""
+    try:
+        reset = datetime.fromisoformat(response.headers['X-RateLimit-Reset'].replace('Z', '+00:00'))
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return 0.0
+    if reset.tzinfo is None:
+        reset = reset.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdmissionController:
+    """Gate for concurrent calls whose limit adapts to observed latency and server throttling"""
+
+    def __init__(self, min_limit: int = 1, max_limit: int = 10, target_latency: float = 2.0,
+                 window: int = 5, decrease_factor: float = 0.5, initial_limit: Optional[int] = None):
+        """
+        min_limit/max_limit: bounds on concurrent calls
+        target_latency: mean latency (seconds) a window of successes must stay under to raise the limit
+        window: successes per additive step
+        initial_limit: starting limit (defaults to half of max_limit)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.target_latency = target_latency
+        self.decrease_factor = decrease_factor
+        start = initial_limit if initial_limit is not None else self.max_limit // 2
+        self.limit = min(self.max_limit, max(self.min_limit, start))
+
+        self._in_flight = 0
+        self._latencies = deque(maxlen=max(1, window))
+        self._resume_at = 0.0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def admit(self):
+        """Hold one slot for the duration of a call, recording its latency and outcome"""
+        self._acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._release(started, e)
+            raise
+        else:
+            self._release(started, None)
+
+    def observe_response(self, response):
+        """
+        Inspect a response seen mid-call (every one the HTTP layer receives, including 429s it is about to resend)
+        A 429 counts as overload; otherwise the remaining quota caps the limit, and an exhausted one pauses admissions
+        """
+        with self._cond:
+            if response.status_code == 429:
+                self._on_overload(response.status_code, response)
+                return
+            remaining = _rate_limit_remaining(response)
+            if remaining is None or remaining >= self.limit:
+                return
+            self.limit = max(self.min_limit, remaining)
+            if remaining <= 0:
+                # Without a usable reset time, hold off for one target latency and let the next response decide
+                pause = _rate_limit_reset(response) or self.target_latency
+                self._resume_at = max(self._resume_at, time.monotonic() + pause)
+                logger.warning(f"Jira rate limit quota exhausted; pausing new calls for {pause:g}s")
+            else:
+                logger.debug("Jira quota has {} requests left; concurrency lowered to {}", remaining, self.limit)
+
+    def _acquire(self):
+        with self._cond:
+            while True:
+                wait = self._resume_at - time.monotonic()
+                if wait <= 0 and self._in_flight < self.limit:
+                    break
+                self._cond.wait(timeout=wait if wait > 0 else None)
+            self._in_flight += 1
+
+    def _release(self, started: float, error: Optional[Exception]):
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', None)
+        with self._cond:
+            self._in_flight -= 1
+            if status is not None and (status == 429 or status >= 500):
+                self._on_overload(status, response)
+            elif error is None and started >= self._last_decrease:  # Calls admitted before a cut don't vote
+                self._on_success(time.monotonic() - started)
+            self._cond.notify_all()
+
+    def _on_success(self, latency: float):
+        """Additive increase: +1 after a full window of successes averaging under the target latency"""
+        self._latencies.append(latency)
+        if len(self._latencies) < self._latencies.maxlen:
+            return
+        if sum(self._latencies) / len(self._latencies) <= self.target_latency and self.limit < self.max_limit:
+            self.limit += 1
+            logger.debug("Jira concurrency raised to {}", self.limit)
+        self._latencies.clear()
+
+    def _on_overload(self, status: int, response):
+        """Multiplicative decrease, at most once per target_latency so one burst of failures cuts once"""
+        now = time.monotonic()
+        retry_after = _retry_after(response)
+        if retry_after:
+            self._resume_at = max(self._resume_at, now + retry_after)
+        if now - self._last_decrease < self.target_latency:
+            return
+        self._last_decrease = now
+        self._latencies.clear()
+        self.limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+        logger.warning(f"Jira returned {status}; concurrency cut to {self.limit}, pausing {retry_after:g}s")
@@ -0,0 +1,39 @@
+"""
+Token-budget helpers for LLM prompts.
+Uses tiktoken's cl100k_base encoding when it is installed and a word/punctuation estimate otherwise.
+"""
+import re
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # Optional: the estimate below keeps prompts within roughly the same budget
+    tiktoken = None
+
+# Approximates BPE tokenization: each word run or punctuation mark counts as one token
+_RE_APPROX_TOKEN = re.compile(r'\w+|[^\w\s]')
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """Shared tokenizer, loaded once per process (None when unavailable)"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception:  # Encoding files are fetched on first use; offline hosts fall back to the estimate
+        return None
+
+
+@lru_cache(maxsize=256)
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens, keeping whole tokens (cached: the same prompt feeds several calls)"""
+    encoding = _encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+    for count, match in enumerate(_RE_APPROX_TOKEN.finditer(text), 1):
+        if count == max_tokens:
+            return text[:match.end()]
+    return text
@@ -27,6 +27,10 @@ def convert_to_adf(text):
     """
     return text_formatter.convert_to_adf(text)
 
+def convert_to_adf_bytes(text):
+    """convert_to_adf pre-serialized to JSON bytes, for request bodies that don't need the dict"""
+    return text_formatter.convert_to_adf_bytes(text)
+
 def process_bold_text(text):
     """Process bold text marked with ** in the content"""
     result = []
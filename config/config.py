@@ -63,6 +63,10 @@ def get_optional_config() -> Dict[str, Any]:
         'quiet_mode': get_env_var('QUIET_MODE', 'false', required=False).lower() in ('true', '1', 'yes'),
         'max_retries': int(get_env_var('MAX_RETRIES', '3', required=False)),
         'timeout': int(get_env_var('TIMEOUT', '30', required=False)),
+        # Adaptive concurrency bounds for Jira create calls (grows while latency stays under the target)
+        'jira_min_workers': int(get_env_var('JIRA_MIN_WORKERS', '1', required=False)),
+        'jira_max_workers': int(get_env_var('JIRA_MAX_WORKERS', '5', required=False)),
+        'jira_target_latency': float(get_env_var('JIRA_TARGET_LATENCY', '2.0', required=False)),  # seconds
         'cache_ttl': int(get_env_var('CACHE_TTL', '300', required=False)),  # 5 minutes default
         
         # AI Configuration Options
@@ -71,6 +75,10 @@ def get_optional_config() -> Dict[str, Any]:
         'cache_scenarios': get_env_var('CACHE_SCENARIOS', 'true', required=False).lower() in ('true', '1', 'yes'),
         'min_scenarios': int(get_env_var('MIN_SCENARIOS', '3', required=False)),
         'max_scenarios': int(get_env_var('MAX_SCENARIOS', '10', required=False)),
+        'scenario_cache_path': get_env_var('SCENARIO_CACHE_PATH', '', required=False),  # opt-in: e.g. ~/.jira_ai/scenario_cache.db
+        'scenario_cache_ttl': int(get_env_var('SCENARIO_CACHE_TTL', '604800', required=False)),  # 7 days default
+        'dedupe_across_stories': get_env_var('DEDUPE_ACROSS_STORIES', 'false', required=False).lower() in ('true', '1', 'yes'),
+        'hedge_ai_requests': get_env_var('HEDGE_AI_REQUESTS', 'false', required=False).lower() in ('true', '1', 'yes'),
         
         # Free AI Service Options
         'huggingface_token': get_env_var('HUGGINGFACE_TOKEN', '', required=False),
@@ -89,6 +97,10 @@ def get_ai_config() -> Dict[str, Any]:
         'cache_enabled': optional_config['cache_scenarios'],
         'min_scenarios': optional_config['min_scenarios'],
         'max_scenarios': optional_config['max_scenarios'],
+        'cache_path': optional_config['scenario_cache_path'],
+        'cache_ttl': optional_config['scenario_cache_ttl'],
+        'dedupe_across_stories': optional_config['dedupe_across_stories'],
+        'hedge_ai_requests': optional_config['hedge_ai_requests'],
         'free_tier_only': optional_config['use_free_tier'],
         
         # Free service endpoints
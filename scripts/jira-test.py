@@ -168,11 +168,14 @@ def create_test_scenarios(story_key: str, is_manual: bool = False) -> bool:
         else:
             # AI-powered approach
             generator = StoryTestGenerator(config.config)
-            success = generator.generate_and_create_scenarios(
-                story_key,
-                journey=journey_type,
-                is_manual=False
-            )
+            try:
+                success = generator.generate_and_create_scenarios(
+                    story_key,
+                    journey=journey_type,
+                    is_manual=False
+                )
+            finally:
+                generator.close()
         
         return success
         
@@ -243,6 +246,8 @@ def main():
     except Exception as e:
         generator.log_progress(f"Error processing story: {str(e)}", "error")
         sys.exit(1)
+    finally:
+        generator.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file